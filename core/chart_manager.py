@@ -3,12 +3,13 @@ This file is part of a project licensed under the Non-Commercial Public License
 See LICENSE file or contact the authors for full terms.
 """
 
-from PySide6.QtWidgets import QSizePolicy, QLabel, QToolTip
+from PySide6.QtWidgets import QSizePolicy, QLabel, QToolTip, QGraphicsLineItem
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QLegend, QValueAxis
 from PySide6.QtGui import QPainter, QFont, QColor
-from PySide6.QtCore import Qt, QMargins, QPointF, Signal
+from PySide6.QtCore import Qt, QMargins, QPointF, QPoint, Signal, QTimer
 from utils.config import CHART_CONFIG, COLOR_PALETTE, MOTOR_COLORS, ALTERNATIVE_COLOR_PALETTE, ALTERNATIVE_MOTOR_COLORS
 from utils.data_processor import get_clean_name, decimate_data
+import numpy as np
 
 class ClickableChartView(QChartView):
     """A QChartView that emits a signal when clicked."""
@@ -29,6 +30,12 @@ class ChartManager:
         self.actual_time_max = None
         self.parent = None  # Add parent property
         self.current_log_count = 0  # Track how many logs are loaded
+        # Coalesce mouse moves into at most one tooltip update per frame
+        self._pending_tooltip = None
+        self._last_tooltip_text = None
+        self._tooltip_timer = QTimer()
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.timeout.connect(self._do_tooltip)
 
     def create_chart_views(self, parent, min_chart_height):
         """Create and initialize chart views"""
@@ -48,12 +55,24 @@ class ChartManager:
             chart.legend().setVisible(False)
             chart.setMargins(QMargins(10, 10, 10, 10))
             chart_view.setChart(chart)
+            chart_view._series_cache = []  # Data series looked up by the tooltip
             
             # Add tooltip support only to the throttle chart (index 3)
             if i == 3:  # Throttle chart
+                # Tooltip geometry is cached and dropped whenever the plot area moves
+                chart.plotAreaChanged.connect(lambda _, cv=chart_view: self._invalidate_tooltip_geometry(cv))
                 chart_view.setMouseTracking(True)
                 chart_view.mouseMoveEvent = lambda event, cv=chart_view: self.show_tooltip(event, cv)
                 chart_view.setCursor(Qt.CrossCursor)  # Add crosshair cursor
+                # Vertical cross-hair line, created once and only moved on mouse moves
+                chart_view._track_line = QGraphicsLineItem()
+                chart_view._track_line.setZValue(1000)
+                pen = chart_view._track_line.pen()
+                pen.setColor(QColor(255, 0, 0, 128))
+                pen.setWidth(1)
+                chart_view._track_line.setPen(pen)
+                chart_view._track_line.setVisible(False)
+                chart_view.scene().addItem(chart_view._track_line)
             
             self.chart_views.append(chart_view)
             
@@ -114,9 +133,14 @@ class ChartManager:
             pen.setColor(color)
             pen.setWidthF(line_width)  # Only user data series get the custom line width
             series.setPen(pen)
+            series._pen_width = line_width  # Lets line-width changes skip series already at that width
 
-            for t, v in zip(data['time'], data['values']):
-                series.append(t, v)
+            # Keep the sorted samples as arrays for fast tooltip lookups
+            series._xs = np.asarray(data['time'], dtype=float)
+            series._ys = np.asarray(data['values'], dtype=float)
+            # One bulk replace instead of a pointAdded round-trip per sample
+            series.replace([QPointF(t, v) for t, v in zip(series._xs.tolist(), series._ys.tolist())])
+            series._tooltip_fmt = self._tooltip_format(clean_name)
 
             chart_view.chart().addSeries(series)
             added_series.append(series)
@@ -174,6 +198,9 @@ class ChartManager:
                     axis_y.setTickCount(6)   # Every 200 units
                 else:
                     axis_y.setTickCount(6)   # Every 100 units or less
+        # Axes were recreated, so drop cached tooltip geometry and track their ranges
+        self._invalidate_tooltip_geometry(chart_view)
+        axis_x.rangeChanged.connect(lambda *_, cv=chart_view: self._invalidate_tooltip_geometry(cv))
         # Make sure zero line is attached to the axes
         if chart_title in ["Roll", "Pitch", "Yaw"]:
             for series in chart_view.chart().series():
@@ -181,6 +208,7 @@ class ChartManager:
                     series.attachAxis(axis_x)
                     series.attachAxis(axis_y)
                     break
+        self._refresh_series_cache(chart_view)
         
         return added_series
 
@@ -237,6 +265,7 @@ class ChartManager:
                 for series in chart_view.chart().series():
                     chart_view.chart().removeSeries(series)
                     series.deleteLater()
+                chart_view._series_cache = []
                 chart_view.chart().update()
 
     def plot_features(self, df, selected_features, progress_bar=None, line_width=1.0, clear_charts=True, log_name=None):
@@ -271,8 +300,6 @@ class ChartManager:
         time_data = time_data - time_data.min()
         
         # Determine the number of points - use full dataset only when needed
-        # Import the decimate_data function for data reduction
-        from utils.data_processor import decimate_data
         
         # Track what types are actually plotted (for legend)
         plotted_types = set()
@@ -427,14 +454,20 @@ class ChartManager:
                     pen.setColor(color)
                     pen.setWidthF(line_width)  # Only user data series get the custom line width
                     series.setPen(pen)
+                    series._pen_width = line_width  # Lets line-width changes skip series already at that width
 
-                    for t, v in zip(data['time'], data['values']):
-                        series.append(t, v)
+                    # Keep the sorted samples as arrays for fast tooltip lookups
+                    series._xs = np.asarray(data['time'], dtype=float)
+                    series._ys = np.asarray(data['values'], dtype=float)
+                    # One bulk replace instead of a pointAdded round-trip per sample
+                    series.replace([QPointF(t, v) for t, v in zip(series._xs.tolist(), series._ys.tolist())])
+                    series._tooltip_fmt = self._tooltip_format(clean_name)
 
                     chart_view.chart().addSeries(series)
                     series.attachAxis(chart_view.chart().axes(Qt.Horizontal)[0])
                     series.attachAxis(chart_view.chart().axes(Qt.Vertical)[0])
                     added_series.append(series)
+                self._refresh_series_cache(chart_view)
             
             # Track what was plotted for the legend
             for data, series in zip(axis_series, added_series):
@@ -472,78 +505,92 @@ class ChartManager:
         if self.parent and hasattr(self.parent, 'feature_widget'):
             self.parent.feature_widget.update_legend(series_by_category)
 
+    def _tooltip_format(self, name):
+        """Prebuild the tooltip line template for a series name"""
+        # Templates take (value, percentage of full motor output)
+        name_lower = name.lower()
+        if name_lower.startswith('motor'):
+            return f"{name}: {{0:.0f}} ({{1:.1f}}%)"
+        if name_lower == 'throttle' or 'rccommand[3]' in name_lower:
+            return f"{name}: {{0:.0f}} µs"
+        return f"{name}: {{0:.1f}}"
+
+    def _refresh_series_cache(self, chart_view):
+        """Cache the chart's data series so the tooltip doesn't rebuild chart.series() per move"""
+        chart_view._series_cache = [s for s in chart_view.chart().series()
+                                    if s.name() != "Zero" and getattr(s, '_xs', None) is not None]
+
+    def _invalidate_tooltip_geometry(self, chart_view):
+        """Drop the cached plot area and axis range used by the tooltip"""
+        chart_view._tooltip_geometry = None
+
+    def _tooltip_geometry(self, chart_view):
+        """Return cached (x_min, x_max, left, right, top, bottom) for a chart view"""
+        geometry = getattr(chart_view, '_tooltip_geometry', None)
+        if geometry is None:
+            chart = chart_view.chart()
+            axes_x = chart.axes(Qt.Horizontal)
+            if not axes_x or not chart.axes(Qt.Vertical):
+                return None
+            plot_area = chart.plotArea()
+            geometry = (axes_x[0].min(), axes_x[0].max(),
+                        plot_area.left(), plot_area.right(), plot_area.top(), plot_area.bottom())
+            chart_view._tooltip_geometry = geometry
+        return geometry
+
     def show_tooltip(self, event, chart_view):
+        """Queue a tooltip update for the latest mouse position"""
+        # Qt reuses the event object, so keep copies of the positions only
+        self._pending_tooltip = (chart_view, QPointF(event.position()), QPoint(event.globalPos()))
+        if not self._tooltip_timer.isActive():
+            self._tooltip_timer.start(16)
+
+    def _do_tooltip(self):
         """Show tooltip with time and value information"""
+        if self._pending_tooltip is None:
+            return
+        chart_view, pos, global_pos = self._pending_tooltip
         chart = chart_view.chart()
         if not chart:
             return
         # Only show tooltip for throttle chart
         if chart.title() != "Throttle":
             return
-        # Get axes
-        if not chart.axes(Qt.Horizontal) or not chart.axes(Qt.Vertical):
+        geometry = self._tooltip_geometry(chart_view)
+        if geometry is None:
             return
-        axis_x = chart.axes(Qt.Horizontal)[0]
-        axis_y = chart.axes(Qt.Vertical)[0]
-        # Get axis ranges
-        x_min = axis_x.min()
-        x_max = axis_x.max()
-        y_min = axis_y.min()
-        y_max = axis_y.max()
-        # Get plot area geometry
-        plot_area = chart.plotArea()
-        left = plot_area.left()
-        right = plot_area.right()
-        top = plot_area.top()
-        bottom = plot_area.bottom()
+        x_min, x_max, left, right, top, bottom = geometry
         # Map pixel to axis value
         if right - left == 0 or bottom - top == 0:
             return
-        time_val = x_min + (x_max - x_min) * (event.position().x() - left) / (right - left)
-        # Draw or update vertical line
-        scene = chart_view.scene()
-        if not hasattr(chart_view, '_track_line'):
-            from PySide6.QtWidgets import QGraphicsLineItem
-            chart_view._track_line = QGraphicsLineItem()
-            chart_view._track_line.setZValue(1000)
-            pen = chart_view._track_line.pen()
-            pen.setColor(QColor(255, 0, 0, 128))
-            pen.setWidth(1)
-            chart_view._track_line.setPen(pen)
-            scene.addItem(chart_view._track_line)
-        # Calculate X position in scene coordinates
-        x_scene = chart_view.mapToScene(event.pos()).x()
+        time_val = x_min + (x_max - x_min) * (pos.x() - left) / (right - left)
+        # Scene x equals the widget-local x: QChartView keeps its scene rect equal to the frameless viewport
+        x_scene = pos.x()
         # Restrict the line to the plot area
-        if left <= event.position().x() <= right:
+        if left <= pos.x() <= right:
             chart_view._track_line.setLine(x_scene, top, x_scene, bottom)
             chart_view._track_line.setVisible(True)
             # Get all series data at the current time point
             tooltip_lines = [f"Time: {time_val:.2f}s"]
-            all_series = chart.series()
-            for series in all_series:
-                if series.name() == "Zero":
+            for series in getattr(chart_view, '_series_cache', ()):
+                xs = series._xs
+                if len(xs) == 0:
                     continue
-                # Find closest point to current time
-                closest_point = None
-                closest_dist = float('inf')
-                for i in range(series.count()):
-                    point = series.at(i)
-                    dist = abs(point.x() - time_val)
-                    if dist < closest_dist:
-                        closest_dist = dist
-                        closest_point = point
-                if closest_point and closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
-                    name = series.name()
-                    value = closest_point.y()
-                    if name.lower().startswith('motor'):
-                        percentage = (value / 2050) * 100
-                        tooltip_lines.append(f"{name}: {value:.0f} ({percentage:.1f}%)")
-                    elif name.lower() == 'throttle' or 'rccommand[3]' in name.lower():
-                        tooltip_lines.append(f"{name}: {value:.0f} µs")
-                    else:
-                        tooltip_lines.append(f"{name}: {value:.1f}")
+                # Find closest point to current time (xs is sorted)
+                idx = min(int(np.searchsorted(xs, time_val)), len(xs) - 1)
+                if idx > 0 and abs(xs[idx - 1] - time_val) < abs(xs[idx] - time_val):
+                    idx -= 1
+                closest_dist = abs(xs[idx] - time_val)
+                if closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
+                    value = series._ys[idx]
+                    # Args: raw value and percentage of full motor output
+                    tooltip_lines.append(series._tooltip_fmt.format(value, (value / 2050) * 100))
             tooltip = "\n".join(tooltip_lines)
-            QToolTip.showText(event.globalPos(), tooltip, chart_view)
+            # Skip re-showing an identical tooltip
+            if tooltip != self._last_tooltip_text:
+                self._last_tooltip_text = tooltip
+                QToolTip.showText(global_pos, tooltip, chart_view)
         else:
             chart_view._track_line.setVisible(False)
+            self._last_tooltip_text = None
             QToolTip.hideText() 
\ No newline at end of file
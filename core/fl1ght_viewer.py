@@ -8,7 +8,6 @@ import subprocess
 import pandas as pd
 import glob
 import tempfile
-import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QSizePolicy,
     QFileDialog, QTabWidget, QDialog, QListWidget, QListWidgetItem, QDialogButtonBox, QLabel, QApplication
@@ -19,6 +18,7 @@ from PySide6.QtCharts import QChart
 from ui.widgets import FeatureSelectionWidget, ControlWidget, SpectralAnalyzerWidget, StepResponseWidget, FrequencyAnalyzerWidget, PlotExportWidget, ParametersWidget, SpectrogramWidget, ErrorPerformanceWidget, HelpWidget
 from .chart_manager import ChartManager
 from utils.data_processor import normalize_time_data, get_clean_name, decimate_data
+from utils.spectral_utils import sampling_rate
 from utils.config import FONT_CONFIG
 
 class FL1GHTViewer(QWidget):
@@ -46,6 +46,7 @@ class FL1GHTViewer(QWidget):
 
         # Left side - Feature selection
         self.feature_widget = FeatureSelectionWidget()
+        self.feature_widget.set_viewer(self)
         main_layout.addWidget(self.feature_widget, stretch=0)
 
         # Right side - Controls and charts
@@ -702,14 +703,13 @@ class FL1GHTViewer(QWidget):
                             # Store the .bbl file path for this log
                             self.feature_widget.loaded_log_paths[display_filename] = file_path
                             
-                            # Add the filename to the logs list and combo box
+                            # Add the filename to the logs list
                             self.feature_widget.logs_list.addItem(display_filename)
-                            self.feature_widget.logs_combo.addItem(display_filename)
                             
                             # If this is the first log, select it automatically
                             if len(self.feature_widget.loaded_logs) == 1:
                                 self.feature_widget.logs_list.setCurrentRow(0)
-                                self.feature_widget.logs_combo.setCurrentIndex(0)
+                                self.feature_widget.select_log(display_filename)
                                 self.feature_widget.current_log = df
                                 self.df = df
                                 self.feature_widget.df = df
@@ -819,14 +819,13 @@ class FL1GHTViewer(QWidget):
                         # Store the .bbl file path for this log
                         self.feature_widget.loaded_log_paths[filename] = file_path
                         
-                        # Add the filename to the logs list and combo box
+                        # Add the filename to the logs list
                         self.feature_widget.logs_list.addItem(filename)
-                        self.feature_widget.logs_combo.addItem(filename)
                         
                         # If this is the first log, select it automatically
                         if len(self.feature_widget.loaded_logs) == 1:
                             self.feature_widget.logs_list.setCurrentRow(0)
-                            self.feature_widget.logs_combo.setCurrentIndex(0)
+                            self.feature_widget.select_log(filename)
                             self.feature_widget.current_log = df
                             self.df = df
                             self.feature_widget.df = df
@@ -864,10 +863,7 @@ class FL1GHTViewer(QWidget):
         if hasattr(self.feature_widget, 'selected_logs') and self.feature_widget.selected_logs:
             current_tab = self.tab_widget.currentIndex()
             if current_tab == 1:  # Frequency Domain
-                # Always clear the spectrum plot before plotting
-                for (chart_view_full, chart_view_zoom) in self.spectral_widget.chart_views:
-                    chart_view_full.chart().removeAllSeries()
-                    chart_view_zoom.chart().removeAllSeries()
+                # update_spectrum clears the previous spectra itself (clear_charts defaults to True)
                 # If multiple logs are selected, plot all
                 if len(self.feature_widget.selected_logs) > 1:
                     self.plot_multiple_logs_spectral()
@@ -958,23 +954,14 @@ class FL1GHTViewer(QWidget):
         elif current_tab == 3:  # Noise Analysis
             try:
                 # Calculate the Nyquist frequency (half of the sampling rate)
-                time_data = self.feature_widget.current_log['time'].values.astype(float)
-                if time_data.max() > 1e6:
-                    time_data = time_data / 1_000_000.0
-                elif time_data.max() > 1e3:
-                    time_data = time_data / 1_000.0
-                time_data = time_data - time_data.min()
                 # Calculate sampling rate and Nyquist frequency
-                dt = np.mean(np.diff(time_data))
-                fs = 1.0 / dt if dt > 0 else 0.0
+                fs = sampling_rate(self.feature_widget.current_log['time'].to_numpy(copy=False))
                 nyquist_freq = fs / 2.0
                 # Round up to the nearest 50Hz for cleaner display
                 max_freq = int(min(1000, nyquist_freq))
                 if max_freq % 50 != 0:
                     max_freq = ((max_freq // 50) + 1) * 50
-                # Force a complete refresh of the plots
-                self.frequency_analyzer_widget.clear_all_plots()
-                # Update with new data, using the calculated max frequency
+                # Update with new data, using the calculated max frequency (this clears the old plots itself)
                 self.frequency_analyzer_widget.update_frequency_plots(self.feature_widget.current_log, max_freq=max_freq)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to update frequency plots: {str(e)}")
@@ -7,40 +7,196 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog,
     QCheckBox, QLabel, QMessageBox, QGroupBox, QScrollArea,
     QSlider, QProgressBar, QSizePolicy, QComboBox, QToolTip, QGridLayout, QSpinBox,
-    QDialog, QLineEdit, QListWidget, QApplication, QDoubleSpinBox,
+    QDialog, QLineEdit, QListWidget, QListView, QApplication, QDoubleSpinBox,
     QDialogButtonBox, QLineEdit, QTextEdit, QScrollArea, QFrame, QSizePolicy,
     QToolTip, QSplitter, QFormLayout, QSpinBox, QDoubleSpinBox, QComboBox,
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QButtonGroup
+    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QButtonGroup,
+    QGraphicsView, QGraphicsItem, QGraphicsLineItem
 )
-from PySide6.QtGui import QFont, QColor, QPainter, QPen, QIcon, QImage, QPixmap, QPalette
-from PySide6.QtCore import Qt, QMargins, QTimer, QSize, QRect, QPoint, Signal, QPointF
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QIcon, QImage, QPixmap, QPalette, QImageWriter, QStaticText
+from PySide6.QtCore import Qt, QMargins, QTimer, QRect, QRectF, QPoint, Signal, QPointF, QObject, QRunnable, QThreadPool, QByteArray, QBuffer, QIODevice, QItemSelectionModel
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QAreaSeries, QCategoryAxis, QLegend, QBarSet, QBarSeries, QBarCategoryAxis
-from utils.config import FONT_CONFIG, COLOR_PALETTE, MOTOR_COLORS, ALTERNATIVE_COLOR_PALETTE
+from utils.config import FONT_CONFIG, COLOR_PALETTE, MOTOR_COLORS, ALTERNATIVE_COLOR_PALETTE, CHART_CONFIG, EXPORT_CONFIG, COLOR_PALETTE_HEX, MOTOR_COLORS_HEX
 from utils.data_processor import get_clean_name
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from utils.step_trace import StepTrace
 import os
-import matplotlib.cm as cm
-from scipy import signal
-from scipy.ndimage import gaussian_filter1d, gaussian_filter
-from mpl_toolkits.axes_grid1 import make_axes_locatable
-from utils.pid_analyzer_noise import plot_all_noise_from_df, plot_noise_from_df, generate_individual_noise_figures
 import sys
 import json
-import tempfile
-import warnings
-from utils.spectrogram_utils import calculate_spectrogram
+import re
+import io
+import datetime
+import logging
+from functools import partial, lru_cache
+# matplotlib, scipy and the modules built on them are imported where they are used,
+# so startup does not pay for tabs that are never opened
+from utils.spectral_utils import welch_batch, m4_downsample, sampling_rate
 from utils import error_analysis
 
+logger = logging.getLogger(__name__)
+
+# Parsed config/settings.json, read once per process by _load_settings
+_SETTINGS_CACHE = None
+
+@lru_cache(maxsize=None)
+def _settings_path():
+    """Absolute path of config/settings.json next to the launched script, resolved once."""
+    app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(app_dir, "config", "settings.json")
+
+def _load_settings():
+    """Return the parsed settings.json (empty dict if missing or unreadable), reading the file only once."""
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is None:
+        _SETTINGS_CACHE = {}
+        try:
+            settings_path = _settings_path()
+            if os.path.exists(settings_path):
+                with open(settings_path, 'r') as f:
+                    _SETTINGS_CACHE = json.load(f)
+        except Exception as e:
+            print(f"[Settings] Failed to load settings: {e}")
+    return _SETTINGS_CACHE
+
+# Spectral plot types and their FeatureSelectionWidget._feature_mask bits (checkbox order)
+_SPECTRAL_TYPE_BITS = (('raw', 1 << 0), ('filtered', 1 << 1), ('pterm', 1 << 2), ('iterm', 1 << 3),
+                       ('dterm', 1 << 4), ('setpoint', 1 << 6), ('rc', 1 << 7))
+
+def _spectral_types(color_palette):
+    """Map spectral type -> (column pattern, legend label, QColor) for one palette."""
+    return {
+        'raw': ('gyroUnfilt[{}]', 'Gyro (raw)', QColor(*color_palette.get('Gyro (raw)', (255, 0, 255)))),
+        'filtered': ('gyroADC[{}] (deg/s)', 'Gyro (filtered)', QColor(*color_palette.get('Gyro (filtered)', (0, 255, 255)))),
+        'pterm': ('axisP[{}]', 'P-Term', QColor(*color_palette.get('P-Term', (255, 200, 0)))),
+        'iterm': ('axisI[{}]', 'I-Term', QColor(*color_palette.get('I-Term', (255, 128, 0)))),
+        'dterm': ('axisD[{}]', 'D-Term', QColor(*color_palette.get('D-Term', (128, 0, 255)))),
+        'setpoint': ('setpoint[{}]', 'Setpoint', QColor(*color_palette.get('Setpoint', (0, 0, 0)))),
+        'rc': ('rcCommand[{}]', 'RC Command', QColor(*color_palette.get('RC Command', (128, 128, 0)))),
+    }
+
+def _m4_buckets(chart_view):
+    """M4 bucket count for a chart view: its width in device pixels."""
+    return int(chart_view.width() * chart_view.devicePixelRatioF())
+
+def _m4_fill(series, n_buckets):
+    """Refill a PSD series with the M4 reduction of its stored _freqs/_psd_db for n_buckets pixel columns."""
+    plot_freqs, plot_psd = m4_downsample(series._freqs, series._psd_db, n_buckets)
+    series.replace([QPointF(f, p) for f, p in zip(plot_freqs.tolist(), plot_psd.tolist())])
+    series._m4_buckets = n_buckets
+
+# Built once at import instead of on every update_spectrum call
+_SPECTRAL_TYPES = _spectral_types(COLOR_PALETTE)
+_SPECTRAL_TYPES_ALT = _spectral_types(ALTERNATIVE_COLOR_PALETTE)
+
+# Numeric order of the debug_level setting values
+_DEBUG_LEVELS = {"INFO": 1, "DEBUG": 2, "VERBOSE": 3}
+
+# Legend label HTML: <span style='color: #rrggbb'>●</span> Label
+_LEGEND_RE = re.compile(r"color:\s*([^'\"]+)[^>]*>([^<]*)<[^>]*>([^<]*)")
+
+@lru_cache(maxsize=8)
+def _parse_bbl_header(bbl_path, mtime_ns, size):
+    """Read the 'H ' header lines of a .bbl file into {section: [(key, value), ...]}, memoized per file version."""
+    sections = {}
+    seen_params = set()  # Keep track of parameters we've already seen
+    try:
+        with open(bbl_path, 'r', encoding='latin-1', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith('H '):
+                    continue
+                # Remove the leading 'H '
+                line = line[2:]
+                # Only process lines with a colon
+                if ':' not in line:
+                    continue
+                # Try to split into section and value
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+                # Skip if we've already seen this parameter
+                if key in seen_params:
+                    continue
+                seen_params.add(key)
+                # Group by the part before the first space (e.g., 'Field I', 'Firmware', etc.)
+                section = key.split(' ')[0] if ' ' in key else key
+                if section not in sections:
+                    sections[section] = []
+                sections[section].append((key, value))
+        return sections
+    except Exception as e:
+        print(f"[ParametersWidget] Failed to parse .bbl header: {e}")
+        return {}
+
+# Result of the one-time OpenGL probe (None until _opengl_available runs)
+_GL_AVAILABLE = None
+
+def _opengl_available():
+    """Whether an OpenGL context can actually be created and made current, probed once per process."""
+    global _GL_AVAILABLE
+    if _GL_AVAILABLE is None:
+        _GL_AVAILABLE = False
+        try:
+            from PySide6.QtGui import QOpenGLContext, QOffscreenSurface
+            surface = QOffscreenSurface()
+            surface.create()
+            context = QOpenGLContext()
+            # Driver/context failures only show up here, not when QOpenGLWidget is constructed
+            if surface.isValid() and context.create() and context.makeCurrent(surface):
+                context.doneCurrent()
+                _GL_AVAILABLE = True
+            surface.destroy()
+        except Exception as e:
+            logger.debug("OpenGL probe failed: %s", e)
+        if not _GL_AVAILABLE:
+            logger.debug("OpenGL unavailable, charts use the raster viewport")
+    return _GL_AVAILABLE
+
 class ClickableChartView(QChartView):
     """A QChartView that emits a signal when clicked."""
     clicked = Signal()
+    resized = Signal()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Only repaint the dirty region (e.g. the crosshair) on mouse moves
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+
+    def setChart(self, chart):
+        """Set the chart and cache its static background as a device pixmap."""
+        chart.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        super().setChart(chart)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def enable_opengl(self):
+        """Rasterize through an OpenGL viewport if enabled in CHART_CONFIG and a GL context works."""
+        if not CHART_CONFIG.get('use_opengl', False) or not _opengl_available():
+            return False
+        try:
+            from PySide6.QtOpenGLWidgets import QOpenGLWidget
+            self.setViewport(QOpenGLWidget())
+        except Exception as e:
+            # Keep the default raster viewport
+            logger.debug("OpenGL viewport unavailable: %s", e)
+            return False
+        # Replaces the MinimalViewportUpdate set in __init__: a GL viewport redraws the
+        # whole frame anyway, so partial updates would only add overhead
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        return True
+
+    def create_track_line(self):
+        """Add the hidden vertical cross-hair line used by the tooltips."""
+        self._track_line = QGraphicsLineItem()
+        self._track_line.setZValue(1000)
+        pen = self._track_line.pen()
+        pen.setColor(QColor(255, 0, 0, 128))
+        pen.setWidth(1)
+        self._track_line.setPen(pen)
+        self._track_line.setVisible(False)
+        self.scene().addItem(self._track_line)
 
     def mousePressEvent(self, event):
         """Emit the clicked signal on a mouse press event."""
@@ -48,6 +204,9 @@ class ClickableChartView(QChartView):
         super().mousePressEvent(event)
 
 class FeatureSelectionWidget(QWidget):
+    # Emitted (debounced) when the Time Domain plot should be refreshed
+    updateRequested = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Initialize settings attributes
@@ -56,49 +215,66 @@ class FeatureSelectionWidget(QWidget):
         self.export_dir = os.path.expanduser("~/Desktop")
         self.use_drone_in_filename = False
         self.debug_level = "INFO"  # Can be 'INFO', 'DEBUG', 'VERBOSE'
-        # Try to load from settings.json in config folder
-        try:
-            import json
-            app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            config_dir = os.path.join(app_dir, "config")
-            settings_path = os.path.join(config_dir, "settings.json")
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    self.author_name = settings.get('author_name', self.author_name)
-                    self.drone_name = settings.get('drone_name', self.drone_name)
-                    self.export_dir = settings.get('export_dir', self.export_dir)
-                    self.use_drone_in_filename = settings.get('use_drone_in_filename', self.use_drone_in_filename)
-                    self.debug_level = settings.get('debug_level', self.debug_level)
-        except Exception as e:
-            print(f"[FeatureSelectionWidget] Failed to load settings: {e}")
+        # Apply settings.json from the config folder (parsed once per process)
+        settings = _load_settings()
+        self.author_name = settings.get('author_name', self.author_name)
+        self.drone_name = settings.get('drone_name', self.drone_name)
+        self.export_dir = settings.get('export_dir', self.export_dir)
+        self.use_drone_in_filename = settings.get('use_drone_in_filename', self.use_drone_in_filename)
+        self.debug_level = settings.get('debug_level', self.debug_level)
+        # Leveled logger for the DEBUG traces: disabled messages cost one level check, no formatting
+        self._log = logger.getChild('FeatureSelectionWidget')
+        self._apply_debug_level()
         self.loaded_logs = {}  # Dictionary to store loaded logs
         self.loaded_log_paths = {}  # Dictionary to store paths to original .bbl files
         self.selected_logs = []  # List to store selected logs
+        self._last_selection_tab = None  # Tab the current selected_logs were applied in
         self.current_log = None  # Current log being displayed
         self.df = None  # Current dataframe
+        self._col_index = None  # Feature -> column names for _col_index_df
+        self._col_index_df = None
         self.current_line_width = 1.0  # Default line width
+        self._viewer = None  # Owning FL1GHTViewer, resolved once from the parent chain
+        self._font_cache = {}  # font_type -> QFont, see create_font
+        self._pen_cache = {}  # (color, style, cap, join, width) -> QPen, see _pen_with_width
+        # Single reusable debounce timer; its timeout is forwarded as updateRequested
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self.updateRequested)
+        self.updateRequested.connect(self._do_update, Qt.QueuedConnection)
         self.setup_ui()
         self.setup_connections()
 
+    def set_viewer(self, viewer):
+        """Inject the owning FL1GHTViewer so no parent chain has to be walked"""
+        self._viewer = viewer
+
+    def _find_viewer(self):
+        """Return the owning FL1GHTViewer (injected via set_viewer, else found once in the parent chain)"""
+        if self._viewer is None:
+            # The widget is reparented by the viewer's layout, so resolve lazily
+            parent = self.parent()
+            while parent is not None and not hasattr(parent, 'plot_selected'):
+                parent = parent.parent()
+            self._viewer = parent
+        return self._viewer
+
     def get_current_tab_index(self):
         """Safely get the current tab index"""
         try:
-            # Try to get the tab widget through the parent hierarchy
-            parent = self.parent()
-            while parent is not None:
-                if hasattr(parent, 'tab_widget'):
-                    return parent.tab_widget.currentIndex()
-                parent = parent.parent()
+            viewer = self._find_viewer()
+            if viewer is not None and hasattr(viewer, 'tab_widget'):
+                return viewer.tab_widget.currentIndex()
             return 0  # Default to time domain tab if we can't find the tab widget
         except Exception:
             return 0  # Default to time domain tab if anything goes wrong
 
     def setup_connections(self):
+        # The only place this is connected; UniqueConnection guards against a second connect
         # Connect list widget selection change
-        self.logs_list.itemSelectionChanged.connect(self.on_logs_selection_changed)
-        # Connect combo box selection change
-        self.logs_combo.currentIndexChanged.connect(self.on_log_selected)
+        self.logs_list.itemSelectionChanged.connect(self.on_logs_selection_changed, Qt.UniqueConnection)
+        # Per-tab selection limits share one permanent slot instead of being rewired on every tab switch
+        self.logs_list.itemSelectionChanged.connect(self._dispatch_log_selection, Qt.UniqueConnection)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)  # Changed back to vertical layout
@@ -129,6 +305,11 @@ class FeatureSelectionWidget(QWidget):
         self.logs_list = QListWidget()
         self.logs_list.setFont(self.create_font('label'))
         self.logs_list.setSelectionMode(QListWidget.ExtendedSelection)
+        # Every row is a single line of the same font, so Qt can size them all from the first one
+        self.logs_list.setUniformItemSizes(True)
+        # Lay rows out in batches so adding many logs never blocks on a full relayout
+        self.logs_list.setLayoutMode(QListView.Batched)
+        self.logs_list.setBatchSize(50)
         self.logs_list.setStyleSheet("""
             QListWidget {
                 background-color: #2d2d2d;
@@ -171,15 +352,8 @@ class FeatureSelectionWidget(QWidget):
                 background: none;
             }
         """)
-        self.logs_list.itemSelectionChanged.connect(self.on_logs_selection_changed)
         file_controls.addWidget(self.logs_list)
 
-        # Keep the single log combo for compatibility but hide it
-        self.logs_combo = QComboBox()
-        self.logs_combo.setVisible(False)
-        self.logs_combo.currentIndexChanged.connect(self.on_log_selected)
-        file_controls.addWidget(self.logs_combo)
-
         # Plot button - single button for both single and multi-log plotting
         self.plot_button = QPushButton("Show Plot")
         self.plot_button.setFont(self.create_font('button'))
@@ -234,6 +408,30 @@ class FeatureSelectionWidget(QWidget):
         self.create_pid_group()
         self.create_rc_group()
         self.create_motor_group()
+        # Every feature checkbox, for the bulk enable/uncheck/count helpers
+        self._all_feature_checkboxes = (
+            self.gyro_unfilt_checkbox, self.gyro_scaled_checkbox,
+            self.pid_p_checkbox, self.pid_i_checkbox, self.pid_d_checkbox,
+            self.pid_f_checkbox, self.setpoint_checkbox, self.rc_checkbox,
+            self.throttle_checkbox, self.motor_checkbox)
+        # Bit i of _feature_mask mirrors _all_feature_checkboxes[i], so hot paths test one int
+        self._feature_mask = 0
+        for bit, checkbox in enumerate(self._all_feature_checkboxes):
+            if checkbox.isChecked():
+                self._feature_mask |= 1 << bit
+            checkbox.toggled.connect(partial(self._on_feature_toggled, 1 << bit))
+        # Column-index bucket and warning label behind each checkbox, in checkbox order
+        self._feature_columns = (
+            (self.gyro_unfilt_checkbox, 'gyrounfilt', "Gyro (raw)"),
+            (self.gyro_scaled_checkbox, 'gyroadc_degs', "Gyro (filtered)"),
+            (self.pid_p_checkbox, 'axisp', "P-Term"),
+            (self.pid_i_checkbox, 'axisi', "I-Term"),
+            (self.pid_d_checkbox, 'axisd', "D-Term"),
+            (self.pid_f_checkbox, 'axisf', "FeedForward"),
+            (self.setpoint_checkbox, 'setpoint', "Setpoint"),
+            (self.rc_checkbox, 'rccommand_nothrottle', "RC Commands"),
+            (self.throttle_checkbox, 'rccommand_throttle', "Throttle"),
+            (self.motor_checkbox, 'motor', "Motor Outputs"))
         
         self.feature_scroll.setWidget(self.feature_widget)
         layout.addWidget(self.feature_scroll)
@@ -244,12 +442,35 @@ class FeatureSelectionWidget(QWidget):
         # Add legend area at the bottom
         self.legend_group = QGroupBox("Plot Legend")
         self.legend_group.setFont(self.create_font('title'))
-        self.legend_group.setStyleSheet("QGroupBox { background-color: #444; border: none; }")
+        # One sheet for the whole legend, so entries need no per-widget stylesheets
+        self.legend_group.setStyleSheet("""
+            QGroupBox { background-color: #444; border: none; }
+            QGroupBox QLabel, QWidget#legendMotors { background: transparent; }
+            QLabel[legendDot="true"] { font-size: 14px; }
+        """)
         self.legend_layout = QVBoxLayout()
         self.legend_layout.setSpacing(10)  # Restore original spacing
         self.legend_layout.setContentsMargins(10, 10, 10, 10)  # Restore original margins
         self.legend_group.setLayout(self.legend_layout)
         layout.addWidget(self.legend_group)
+        # Persistent legend widgets, updated in place by update_legend
+        self._legend_text = QLabel()  # All non-motor entries as one rich-text block
+        self._legend_text.setTextFormat(Qt.RichText)
+        self._legend_text.setFont(self.create_font('label'))
+        self._legend_text.hide()
+        self.legend_layout.addWidget(self._legend_text)
+        self._legend_motors = QWidget()  # "Motors:" title plus a grid of dot/number pairs, 4 per row
+        self._legend_motors.setObjectName("legendMotors")
+        self._legend_motors_layout = QGridLayout(self._legend_motors)
+        self._legend_motors_layout.setSpacing(10)
+        self._legend_motors_layout.setContentsMargins(0, 0, 0, 0)
+        self._legend_motors_layout.setColumnStretch(8, 1)
+        motors_title = QLabel("Motors:")
+        motors_title.setFont(self.create_font('label'))
+        self._legend_motors_layout.addWidget(motors_title, 0, 0, 1, 8)
+        self._legend_motor_labels = []  # (dot, number) label pairs, grown on demand
+        self._legend_motors.hide()
+        self.legend_layout.addWidget(self._legend_motors)
 
         # Add line width label above the slider/settings row
         self.line_width_label = QLabel("Line Width: 1.0px")
@@ -264,7 +485,14 @@ class FeatureSelectionWidget(QWidget):
         self.line_width_slider.setValue(2)    # 1.0 * 2
         self.line_width_slider.setTickPosition(QSlider.NoTicks)
         self.line_width_slider.setFixedWidth(100)  # Make slider more narrow
-        self.line_width_slider.valueChanged.connect(self.line_width_changed)
+        # Debounce drags: re-pen the charts only once the slider has settled for 50ms
+        self._pending_line_width = self.line_width_slider.value()
+        self._line_width_timer = QTimer(self)
+        self._line_width_timer.setSingleShot(True)
+        self._line_width_timer.setInterval(50)
+        self._line_width_timer.timeout.connect(self._apply_line_width)
+        self.line_width_slider.valueChanged.connect(self._schedule_line_width)
+        self.line_width_slider.sliderReleased.connect(self._flush_line_width)
         slider_row.addWidget(self.line_width_slider)
         # Settings button as emoji
         self.settings_button = QPushButton('⚙️')
@@ -350,71 +578,84 @@ class FeatureSelectionWidget(QWidget):
         self.feature_layout.addWidget(self.motor_group)
 
     def create_font(self, font_type):
-        font = QFont(FONT_CONFIG[font_type]['family'])
-        font.setPointSize(FONT_CONFIG[font_type]['size'])
-        if FONT_CONFIG[font_type]['weight'] == 'bold':
-            font.setBold(True)
+        # One shared QFont per style; setFont copies it, so callers must not mutate the result
+        font = self._font_cache.get(font_type)
+        if font is None:
+            config = FONT_CONFIG[font_type]
+            font = QFont(config['family'])
+            font.setPointSize(config['size'])
+            if config['weight'] == 'bold':
+                font.setBold(True)
+            self._font_cache[font_type] = font
         return font
 
+    def _column_index(self):
+        """Columns of the current df bucketed by feature, built in one pass and cached per df."""
+        if self._col_index_df is self.df and self._col_index is not None:
+            return self._col_index
+        index = {key: [] for key in ('gyrounfilt', 'gyroadc_degs', 'axisp', 'axisi', 'axisd', 'axisf',
+                                     'setpoint', 'rccommand_nothrottle', 'rccommand_throttle', 'motor')}
+        for col in self.df.columns:
+            lower = col.lower()
+            if 'gyrounfilt' in lower:
+                index['gyrounfilt'].append(col)
+            if 'gyroadc' in lower and '(deg/s)' in col:
+                index['gyroadc_degs'].append(col)
+            for key in ('axisp', 'axisi', 'axisd', 'axisf', 'setpoint'):
+                if key in lower:
+                    index[key].append(col)
+            if 'rccommand' in lower and '[3]' not in col:
+                index['rccommand_nothrottle'].append(col)
+            if 'rccommand[3]' in lower:
+                index['rccommand_throttle'].append(col)
+            if lower.startswith('motor['):
+                index['motor'].append(col)
+        # Keyed on the df object itself, so any reassignment of self.df invalidates it
+        self._col_index = index
+        self._col_index_df = self.df
+        return index
+
     def get_selected_features(self):
         """Get list of selected features"""
+        # Nothing to select from until a log with columns is loaded
+        if self.df is None or not len(self.df.columns):
+            return []
         selected_features = []
-        
-        # Handle gyro data
-        if self.gyro_unfilt_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'gyrounfilt' in col.lower()])
-        if self.gyro_scaled_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'gyroadc' in col.lower() and '(deg/s)' in col])
-        
-        # Handle PID data
-        if self.pid_p_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'axisp' in col.lower()])
-        if self.pid_i_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'axisi' in col.lower()])
-        if self.pid_d_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'axisd' in col.lower()])
-        if self.pid_f_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'axisf' in col.lower()])
-        
-        # Handle Setpoint data
-        if self.setpoint_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'setpoint' in col.lower()])
-        
-        # Handle RC data
-        if self.rc_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'rccommand' in col.lower() and '[3]' not in col])
-        
-        # Handle Throttle data
-        if self.throttle_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if 'rccommand[3]' in col.lower()])
-        
-        # Handle Motor Outputs
-        if self.motor_checkbox.isChecked():
-            selected_features.extend([col for col in self.df.columns if col.lower().startswith('motor[')])
-        
+        index = self._column_index()
+        for checkbox, key, _ in self._feature_columns:
+            if checkbox.isChecked():
+                selected_features.extend(index[key])
         return selected_features
 
-    def update_legend(self, series_by_category):
-        """Update legend items based on the series data (unique label per axis)."""
-        # Clear existing legend items
-        while self.legend_layout.count():
-            item = self.legend_layout.takeAt(0)
+    def clear_legend(self):
+        """Remove transient legend entries and blank the persistent ones"""
+        for i in reversed(range(self.legend_layout.count())):
+            widget = self.legend_layout.itemAt(i).widget()
+            if widget is self._legend_text or widget is self._legend_motors:
+                continue
+            item = self.legend_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
+        self._legend_text.clear()
+        self._legend_text.hide()
+        self._legend_motors.hide()
+
+    def update_legend(self, series_by_category):
+        """Update legend items based on the series data (unique label per axis)."""
+        # Drop entries left by other tabs; the persistent widgets are reused below
+        self.clear_legend()
 
         # If empty, exit early
         if not series_by_category:
             return
             
-        # Add new legend items (sorted alphabetically for consistent display)
+        # Build all non-motor entries (sorted alphabetically for consistent display) as one HTML block
+        lines = []
         for legend_label in sorted(series_by_category.keys()):
             # Special handling for motors
             if legend_label.startswith('Motor'):
                 # Skip individual motor entries as they'll be handled separately
                 continue
-                
-            legend_label_widget = QLabel()
-            legend_label_widget.setFont(self.create_font('label'))
 
             # Get color value
             color_value = series_by_category[legend_label]
@@ -423,148 +664,184 @@ class FeatureSelectionWidget(QWidget):
                 color_name = color_value
             else:
                 # Need to determine color from name
-                color = QColor(*COLOR_PALETTE.get(legend_label, (128, 128, 128)))
-                color_name = color.name()
-
-            # Create a colored dot/square and the label text
-            legend_label_widget.setText(f"<span style='color: {color_name}'>●</span> {legend_label}")
-            # Remove any background color from the label
-            legend_label_widget.setStyleSheet("background: none;")
-            self.legend_layout.addWidget(legend_label_widget)
+                color_name = COLOR_PALETTE_HEX.get(legend_label, '#808080')
+
+            # A colored dot and the label text
+            lines.append(f"<span style='color: {color_name}'>●</span> {legend_label}")
+        if lines:
+            self._legend_text.setText("<br>".join(lines))
+            self._legend_text.show()
             
         # Handle motors separately
         motor_entries = [(label, color) for label, color in series_by_category.items() if label.startswith('Motor')]
         if motor_entries:
-            # Add "Motors:" label
-            motor_label = QLabel("Motors:")
-            motor_label.setFont(self.create_font('label'))
-            motor_label.setStyleSheet("background: transparent;")
-            self.legend_layout.addWidget(motor_label)
-            
-            # Group motors by 4
-            for i in range(0, len(motor_entries), 4):
-                # Create a row for up to 4 motors
-                row_widget = QWidget()
-                row_widget.setStyleSheet("background: transparent;")
-                row_layout = QHBoxLayout(row_widget)
-                row_layout.setSpacing(10)
-                row_layout.setContentsMargins(0, 0, 0, 0)
-                
-                # Add up to 4 motors in this row
-                for j in range(4):
-                    if i + j < len(motor_entries):
-                        label, color_value = motor_entries[i + j]
-                        # Extract motor number (1-based)
-                        try:
-                            motor_num = int(label.split(' ')[1]) + 1
-                        except:
-                            motor_num = i + j + 1
-                        # Create a colored dot
-                        dot_label = QLabel("●")
-                        if isinstance(color_value, str) and color_value.startswith('#'):
-                            color_name = color_value
-                        else:
-                            color = QColor(*MOTOR_COLORS[(motor_num-1) % len(MOTOR_COLORS)])
-                            color_name = color.name()
-                        dot_label.setStyleSheet("color: %s; font-size: 14px; background: transparent;" % color_name)
-                        # Add motor number
-                        motor_num_label = QLabel(f"{motor_num}")
-                        motor_num_label.setFont(self.create_font('label'))
-                        motor_num_label.setStyleSheet("background: transparent;")
-                        # Add dot and number to row
-                        row_layout.addWidget(dot_label)
-                        row_layout.addWidget(motor_num_label)
-                row_layout.addStretch()
-                self.legend_layout.addWidget(row_widget)
+            for idx, (label, color_value) in enumerate(motor_entries):
+                # Extract motor number (1-based)
+                try:
+                    motor_num = int(label.split(' ')[1]) + 1
+                except (IndexError, ValueError):
+                    motor_num = idx + 1
+                if isinstance(color_value, str) and color_value.startswith('#'):
+                    color_name = color_value
+                else:
+                    color_name = MOTOR_COLORS_HEX[(motor_num-1) % len(MOTOR_COLORS_HEX)]
+                # Grow the grid only when more motors are shown than ever before
+                if idx == len(self._legend_motor_labels):
+                    dot_label = QLabel("●")
+                    dot_label.setProperty("legendDot", True)
+                    motor_num_label = QLabel()
+                    motor_num_label.setFont(self.create_font('label'))
+                    row, col = 1 + idx // 4, 2 * (idx % 4)
+                    self._legend_motors_layout.addWidget(dot_label, row, col)
+                    self._legend_motors_layout.addWidget(motor_num_label, row, col + 1)
+                    self._legend_motor_labels.append((dot_label, motor_num_label))
+                dot_label, motor_num_label = self._legend_motor_labels[idx]
+                # Only the color is per dot; size and background come from the legend_group sheet
+                dot_style = "color: %s;" % color_name
+                # Restyling repolishes the label, so only do it when the color changed
+                if dot_label.styleSheet() != dot_style:
+                    dot_label.setStyleSheet(dot_style)
+                motor_num_label.setText(f"{motor_num}")
+                dot_label.show()
+                motor_num_label.show()
+            for dot_label, motor_num_label in self._legend_motor_labels[len(motor_entries):]:
+                dot_label.hide()
+                motor_num_label.hide()
+            self._legend_motors.show()
+
+    def _pen_with_width(self, pen, line_width):
+        """Return a shared pen like pen but with line_width, built once per color/style/width"""
+        key = (pen.color().rgba(), pen.style(), pen.capStyle(), pen.joinStyle(), line_width)
+        cached = self._pen_cache.get(key)
+        if cached is None:
+            cached = QPen(pen)
+            cached.setWidthF(line_width)  # Use setWidthF for floating point width
+            self._pen_cache[key] = cached
+        return cached
+
+    def _set_chart_line_width(self, chart_view, line_width, series_list, is_reference=None):
+        """Give the non-reference series in series_list the new width, repainting the chart once"""
+        chart = chart_view.chart()
+        if not chart:
+            return
+        changed = False
+        # Hold repaints and chart notifications until every series has its new pen
+        chart_view.setUpdatesEnabled(False)
+        chart.blockSignals(True)
+        try:
+            for series in series_list:
+                # Series remember the width last applied to them; skip those already there
+                if getattr(series, '_pen_width', None) == line_width:
+                    continue
+                pen = series.pen()
+                if is_reference is not None and is_reference(series, pen):
+                    continue
+                series.setPen(self._pen_with_width(pen, line_width))
+                series._pen_width = line_width
+                changed = True
+        finally:
+            chart.blockSignals(False)
+            chart_view.setUpdatesEnabled(True)
+        if changed:
+            chart.update()
+
+    def _schedule_line_width(self, value):
+        """Remember the latest slider value and (re)start the debounce timer"""
+        self._pending_line_width = value
+        # The label is cheap, keep it live while dragging
+        self.line_width_label.setText(f"Line Width: {value / 2.0:.1f}px")
+        self._line_width_timer.start()
+
+    def _flush_line_width(self):
+        """Apply a pending line width right away (slider released)"""
+        if self._line_width_timer.isActive():
+            self._line_width_timer.stop()
+            self._apply_line_width()
+
+    def _apply_line_width(self):
+        self.line_width_changed(self._pending_line_width)
 
     def line_width_changed(self, value):
         """Update line width for all series in all charts"""
         # Convert slider value to actual line width (divide by 2)
         line_width = value / 2.0
+        # Nothing to re-pen if the width did not actually change (e.g. a drag back to the start value)
+        if abs(line_width - self.current_line_width) < 1e-6:
+            return
         
         # Store current line width for later use
         self.current_line_width = line_width
         
-        # Get the parent FL1GHTViewer instance
-        parent = self.parent()
-        if parent and hasattr(parent, 'chart_manager'):
+        # Get the FL1GHTViewer instance
+        parent = self._find_viewer()
+        if parent is not None:
             for chart_view in parent.chart_manager.chart_views:
-                if chart_view.chart():
-                    for series in chart_view.chart().series():
-                        # Skip only the zero reference line (black line at y=0)
-                        if series.name() == "Zero" and series.pen().color() == Qt.black:
-                            continue
-                        pen = series.pen()
-                        pen.setWidthF(line_width)  # Use setWidthF for floating point width
-                        series.setPen(pen)
-                    chart_view.chart().update()
-        
-        # Also update Step Response plot if that tab is active
-        if parent and hasattr(parent, 'tab_widget') and hasattr(parent, 'step_response_widget'):
+                # The chart manager's per-view series records already leave out the zero reference line
+                self._set_chart_line_width(chart_view, line_width, getattr(chart_view, '_series_cache', ()))
+            # Also update Step Response plot if that tab is active; its charts are not visible otherwise
             if parent.tab_widget.currentIndex() == 2:
                 # Update line width for existing series without recreating the plot
                 for chart_view in parent.step_response_widget.chart_views:
                     if chart_view.chart():
-                        for series in chart_view.chart().series():
-                            # Skip the reference line (black line at y=1.0)
-                            if series.name() == "Zero" or series.pen().color() == Qt.black:
-                                continue
-                            pen = series.pen()
-                            pen.setWidthF(line_width)
-                            series.setPen(pen)
-                        chart_view.chart().update()
+                        # Skip the reference line (black line at y=1.0)
+                        self._set_chart_line_width(chart_view, line_width, chart_view.chart().series(),
+                                                   lambda series, pen: series.name() == "Zero" or pen.color() == Qt.black)
         
         self.line_width_label.setText(f"Line Width: {line_width:.1f}px")
 
     def notify_spectral_update(self, _):
-        parent = self.parent()
-        # Find the main viewer (FL1GHTViewer) in the parent chain
-        while parent is not None and not hasattr(parent, 'spectral_widget'):
-            parent = parent.parent() if hasattr(parent, 'parent') else None
-        if parent and hasattr(parent, 'spectral_widget') and hasattr(parent, 'df'):
-            parent.spectral_widget.update_spectrum(parent.df)
+        parent = self._find_viewer()
+        # The viewer only gets a df once a log has been loaded
+        df = getattr(parent, 'df', None)
+        if parent is not None and df is not None:
+            parent.spectral_widget.update_spectrum(df)
             
     def notify_parent_update(self, _):
         """Notify parent (FL1GHTViewer) to update the plot with currently selected features"""
-        from PySide6.QtCore import QTimer
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] notify_parent_update: called, selected_logs={getattr(self, 'selected_logs', None)}")
+        self._log.debug("notify_parent_update: called, selected_logs=%s", getattr(self, 'selected_logs', None))
         # If we already have a pending update, don't schedule another one
-        if hasattr(self, 'update_timer') and self.update_timer is not None and self.update_timer.isActive():
-            if self.debug('DEBUG'):
-                print(f"[DEBUG] notify_parent_update: update_timer is active, skipping")
+        if self.update_timer.isActive():
+            self._log.debug("notify_parent_update: update_timer is active, skipping")
             return
-        # Create a timer for delayed update
-        if not hasattr(self, 'update_timer') or self.update_timer is None:
-            self.update_timer = QTimer()
-            self.update_timer.setSingleShot(True)
-            self.update_timer.timeout.connect(self._do_update)
-        # Start or restart the timer (300ms delay)
+        # Start the timer (300ms delay); it emits updateRequested once
         self.update_timer.start(300)
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] notify_parent_update: timer started")
+        self._log.debug("notify_parent_update: timer started")
     
     def _do_update(self):
         """Actually perform the update after the timer expires"""
-        parent = self.parent()
-        # Find the main viewer (FL1GHTViewer) in the parent chain
-        while parent is not None and not hasattr(parent, 'plot_selected'):
-            parent = parent.parent() if hasattr(parent, 'parent') else None
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] _do_update: parent={parent}, tab={parent.tab_widget.currentIndex() if parent and hasattr(parent, 'tab_widget') else None}")
+        parent = self._find_viewer()
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("_do_update: parent=%s, tab=%s", parent, parent.tab_widget.currentIndex() if parent and hasattr(parent, 'tab_widget') else None)
         # Check if we're in the Time Domain tab (index 0)
-        if parent and hasattr(parent, 'tab_widget') and parent.tab_widget.currentIndex() == 0:
+        if parent is not None and parent.tab_widget.currentIndex() == 0:
             # Call plot_selected to update the chart and legend
-            if self.debug('DEBUG'):
-                print(f"[DEBUG] _do_update: calling plot_selected() for Time Domain tab")
+            self._log.debug("_do_update: calling plot_selected() for Time Domain tab")
             parent.plot_selected()
 
+    def _on_feature_toggled(self, bit, checked):
+        """Keep _feature_mask in step with a single feature checkbox"""
+        if checked:
+            self._feature_mask |= bit
+        else:
+            self._feature_mask &= ~bit
+
+    def _set_features_checked(self, checkboxes, checked):
+        """Set several feature checkboxes in one pass with their signals blocked"""
+        for checkbox in checkboxes:
+            checkbox.blockSignals(True)
+        try:
+            for checkbox in checkboxes:
+                checkbox.setChecked(checked)
+        finally:
+            for checkbox in checkboxes:
+                checkbox.blockSignals(False)
+            # toggled was blocked, so rebuild the mask from the checkboxes once
+            self._feature_mask = sum(1 << bit for bit, checkbox in enumerate(self._all_feature_checkboxes)
+                                     if checkbox.isChecked())
+
     def uncheck_all_features(self):
-        for checkbox in [self.gyro_unfilt_checkbox, self.gyro_scaled_checkbox, 
-                         self.pid_p_checkbox, self.pid_i_checkbox, self.pid_d_checkbox,
-                         self.pid_f_checkbox, self.setpoint_checkbox, self.rc_checkbox,
-                         self.throttle_checkbox, self.motor_checkbox]:
-            checkbox.setChecked(False)
+        """Uncheck every feature checkbox without firing ten separate state-change cascades"""
+        self._set_features_checked(self._all_feature_checkboxes, False)
 
     def set_time_domain_mode(self, enabled: bool):
         """Set the widget to time domain mode"""
@@ -580,16 +857,8 @@ class FeatureSelectionWidget(QWidget):
 
     def _set_checkboxes_enabled(self, enabled):
         """Enable or disable all feature checkboxes"""
-        self.gyro_scaled_checkbox.setEnabled(enabled)
-        self.gyro_unfilt_checkbox.setEnabled(enabled)
-        self.pid_p_checkbox.setEnabled(enabled)
-        self.pid_i_checkbox.setEnabled(enabled)
-        self.pid_d_checkbox.setEnabled(enabled)
-        self.pid_f_checkbox.setEnabled(enabled)
-        self.setpoint_checkbox.setEnabled(enabled)
-        self.rc_checkbox.setEnabled(enabled)
-        self.throttle_checkbox.setEnabled(enabled)
-        self.motor_checkbox.setEnabled(enabled)
+        for checkbox in self._all_feature_checkboxes:
+            checkbox.setEnabled(enabled)
 
     def set_step_response_mode(self, enabled):
         """Enable or disable step response mode"""
@@ -604,28 +873,8 @@ class FeatureSelectionWidget(QWidget):
         # Set selection mode for logs list
         if enabled:
             self.logs_list.setSelectionMode(QListWidget.ExtendedSelection)
-            # Connect step response handler
-            import warnings
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_spectral_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_step_response_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-            self.logs_list.itemSelectionChanged.connect(self._handle_step_response_log_selection)
         else:
             self.logs_list.setSelectionMode(QListWidget.SingleSelection)
-            import warnings
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_step_response_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
 
     def set_spectral_mode(self, enabled):
         """Set the widget to frequency domain mode"""
@@ -649,52 +898,16 @@ class FeatureSelectionWidget(QWidget):
             # Enable checkboxes for frequency domain
             self._set_checkboxes_enabled(True)
             # Automatically select gyro (raw) and gyro (filtered) for frequency domain analysis
-            self.gyro_unfilt_checkbox.setChecked(True)
-            self.gyro_scaled_checkbox.setChecked(True)
-            # Connect frequency domain handler
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_step_response_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_spectral_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-            self.logs_list.itemSelectionChanged.connect(self._handle_spectral_log_selection)
+            self._set_features_checked((self.gyro_unfilt_checkbox, self.gyro_scaled_checkbox), True)
         elif current_tab == 2:  # Step Response
             self.logs_list.setSelectionMode(QListWidget.ExtendedSelection)
             # Disable checkboxes for step response
             self._set_checkboxes_enabled(False)
-            # Connect step response handler
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_spectral_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-                try:
-                    self.logs_list.itemSelectionChanged.disconnect(self._handle_step_response_log_selection)
-                except (TypeError, RuntimeError):
-                    pass
-            self.logs_list.itemSelectionChanged.connect(self._handle_step_response_log_selection)
 
     def _handle_step_response_checkbox(self, state):
         """Handle checkbox state changes in step response mode"""
-        # Count how many checkboxes are checked
-        checked_count = sum(1 for checkbox in [
-            self.gyro_scaled_checkbox,
-            self.gyro_unfilt_checkbox,
-            self.pid_p_checkbox,
-            self.pid_i_checkbox,
-            self.pid_d_checkbox,
-            self.pid_f_checkbox,
-            self.setpoint_checkbox,
-            self.rc_checkbox,
-            self.throttle_checkbox,
-            self.motor_checkbox
-        ] if checkbox.isChecked())
+        # Count how many checkboxes are checked (one bit per checked box in _feature_mask)
+        checked_count = bin(self._feature_mask).count('1')
         
         # If more than 3 are checked, uncheck the last one
         if checked_count > 3:
@@ -767,21 +980,30 @@ class FeatureSelectionWidget(QWidget):
             self.drone_name = drone_edit.text()
             self.use_drone_in_filename = drone_checkbox.isChecked()
             self.debug_level = debug_combo.currentText()
+            self._apply_debug_level()
+            settings = {
+                "author_name": self.author_name,
+                "export_dir": self.export_dir,
+                "drone_name": self.drone_name,
+                "use_drone_in_filename": self.use_drone_in_filename,
+                "debug_level": self.debug_level
+            }
+            # Nothing to write if the dialog was saved without changes
+            if settings == _load_settings():
+                dialog.accept()
+                return
+            # Keep the in-memory copy current for everything reading through _load_settings
+            global _SETTINGS_CACHE
+            _SETTINGS_CACHE = settings
             # Save to config/settings.json
-            app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            config_dir = os.path.join(app_dir, "config")
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-            config_path = os.path.join(config_dir, "settings.json")
+            config_path = _settings_path()
+            tmp_path = config_path + ".tmp"
             try:
-                with open(config_path, "w") as f:
-                    json.dump({
-                        "author_name": self.author_name,
-                        "export_dir": self.export_dir,
-                        "drone_name": self.drone_name,
-                        "use_drone_in_filename": self.use_drone_in_filename,
-                        "debug_level": self.debug_level
-                    }, f, indent=2)
+                os.makedirs(os.path.dirname(config_path), exist_ok=True)
+                with open(tmp_path, "w") as f:
+                    json.dump(settings, f, indent=2)
+                # Swap in the complete file so a crash mid-write never leaves a truncated settings.json
+                os.replace(tmp_path, config_path)
             except Exception as e:
                 print(f"[Settings] Failed to save config: {e}")
             dialog.accept()
@@ -802,41 +1024,38 @@ class FeatureSelectionWidget(QWidget):
     def on_logs_selection_changed(self):
         """Handle log selection changes in the list widget"""
         selected_items = self.logs_list.selectedItems()
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] on_logs_selection_changed: selected_items={[item.text() for item in selected_items]}")
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("on_logs_selection_changed: selected_items=%s", [item.text() for item in selected_items])
         if not selected_items:
             return
 
         # Get the current tab
         current_tab = self.get_current_tab_index()
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] on_logs_selection_changed: current_tab={current_tab}")
+        self._log.debug("on_logs_selection_changed: current_tab=%s", current_tab)
         
         # Force single selection for Time Domain, Noise Analysis
         if current_tab in [0, 3]:  # Time Domain, Noise Analysis
             if len(selected_items) > 1:
                 last_selected = selected_items[-1]
-                self.logs_list.clearSelection()
-                last_selected.setSelected(True)
+                self._select_item_silently(last_selected, QItemSelectionModel.ClearAndSelect)
                 selected_items = [last_selected]
-                if self.debug('DEBUG'):
-                    print(f"[DEBUG] on_logs_selection_changed: forced single selection, kept {last_selected.text()}")
+                self._log.debug("on_logs_selection_changed: forced single selection, kept %s", last_selected.text())
         elif current_tab == 5:  # Drone Config
             if len(selected_items) > 2:
                 # Unselect the last selected item
-                selected_items[-1].setSelected(False)
+                self._select_item_silently(selected_items[-1], QItemSelectionModel.Deselect)
                 selected_items = selected_items[:-1]
                 QMessageBox.warning(self, "Warning", "You can only select up to 2 logs for drone config comparison.")
-                if self.debug('DEBUG'):
-                    print(f"[DEBUG] on_logs_selection_changed: forced two selection, kept {[item.text() for item in selected_items]}")
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("on_logs_selection_changed: forced two selection, kept %s", [item.text() for item in selected_items])
         elif current_tab == 1:  # Frequency Domain
             if len(selected_items) > 2:
                 # Unselect the last selected item
-                selected_items[-1].setSelected(False)
+                self._select_item_silently(selected_items[-1], QItemSelectionModel.Deselect)
                 selected_items = selected_items[:-1]
                 QMessageBox.warning(self, "Warning", "You can only select up to 2 logs for frequency domain analysis.")
-                if self.debug('DEBUG'):
-                    print(f"[DEBUG] on_logs_selection_changed: forced two selection for frequency domain, kept {[item.text() for item in selected_items]}")
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("on_logs_selection_changed: forced two selection for frequency domain, kept %s", [item.text() for item in selected_items])
         else:
             # For all other tabs, check if Ctrl/Cmd or Shift key is pressed
             modifiers = QApplication.keyboardModifiers()
@@ -846,62 +1065,66 @@ class FeatureSelectionWidget(QWidget):
             # If not multi-select and more than one item is selected, clear all but the last selected
             if not (is_ctrl_cmd or is_shift) and len(selected_items) > 1:
                 last_selected = selected_items[-1]
-                self.logs_list.clearSelection()
-                last_selected.setSelected(True)
+                self._select_item_silently(last_selected, QItemSelectionModel.ClearAndSelect)
                 selected_items = [last_selected]
-                if self.debug('DEBUG'):
-                    print(f"[DEBUG] on_logs_selection_changed: forced single selection (no multi-select), kept {last_selected.text()}")
+                self._log.debug("on_logs_selection_changed: forced single selection (no multi-select), kept %s", last_selected.text())
+
+        # Focus clicks and programmatic re-selects re-emit the same selection; skip the replot for those
+        selected_logs = [item.text() for item in selected_items]
+        if (selected_logs == self.selected_logs and current_tab == self._last_selection_tab
+                and self.current_log is self.loaded_logs.get(selected_logs[0])):
+            self._log.debug("on_logs_selection_changed: selection unchanged, skipping")
+            return
+        self._last_selection_tab = current_tab
 
         # Update selected_logs list
-        self.selected_logs = [item.text() for item in selected_items]
-        if self.debug('DEBUG'):
-            print(f"[DEBUG] on_logs_selection_changed: self.selected_logs={self.selected_logs}")
+        self.selected_logs = selected_logs
+        self._log.debug("on_logs_selection_changed: self.selected_logs=%s", self.selected_logs)
         
         # Update current log
         if self.selected_logs:
             self.current_log = self.loaded_logs[self.selected_logs[0]]
             self.df = self.current_log
-            if self.debug('DEBUG'):
-                print(f"[DEBUG] on_logs_selection_changed: current_log={self.selected_logs[0]}, df shape={self.df.shape if hasattr(self.df, 'shape') else None}")
-            
-            # Update combo box to match list selection
-            if len(self.selected_logs) == 1:
-                index = self.logs_combo.findText(self.selected_logs[0])
-                if index >= 0:
-                    self.logs_combo.setCurrentIndex(index)
-                    if self.debug('DEBUG'):
-                        print(f"[DEBUG] on_logs_selection_changed: logs_combo set to {self.selected_logs[0]}")
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("on_logs_selection_changed: current_log=%s, df shape=%s", self.selected_logs[0], self.df.shape if hasattr(self.df, 'shape') else None)
             
             # Only notify parent for non-Time Domain tabs
             if current_tab != 0:  # Don't auto-plot in Time Domain tab
                 # For Drone Config tab, pass up to 2 logs
                 if current_tab == 5:  # Drone Config (changed from 4 to 5)
-                    if self.debug('DEBUG'):
-                        print(f"[DEBUG] on_logs_selection_changed: notifying parent for Drone Config tab with logs {self.selected_logs[:2]}")
+                    self._log.debug("on_logs_selection_changed: notifying parent for Drone Config tab with logs %s", self.selected_logs[:2])
                     self.notify_parent_update(self.selected_logs[:2])
                 else:
-                    if self.debug('DEBUG'):
-                        print(f"[DEBUG] on_logs_selection_changed: notifying parent for tab {current_tab}")
+                    self._log.debug("on_logs_selection_changed: notifying parent for tab %s", current_tab)
                     self.notify_parent_update(None)
 
-    def on_log_selected(self, index):
-        """Handle log selection changes in the combo box"""
-        if index < 0:
+    def select_log(self, log_name):
+        """Programmatically select a single loaded log by name"""
+        if not log_name or log_name not in self.loaded_logs:
             return
-            
-        log_name = self.logs_combo.currentText()
-        if not log_name:
-            return
-            
-        # Update list widget selection
+        # Update list widget selection, unless it is already the only selected row
         items = self.logs_list.findItems(log_name, Qt.MatchExactly)
-        if items:
-            self.logs_list.clearSelection()
-            items[0].setSelected(True)
-            
-        # Update current log
+        if items and not (items[0].isSelected() and len(self.logs_list.selectedItems()) == 1):
+            # on_log_selected below applies the change, so skip the selection handlers
+            self._select_item_silently(items[0], QItemSelectionModel.ClearAndSelect)
+        self.on_log_selected(log_name)
+
+    def _select_item_silently(self, item, command):
+        """Apply one selection-model command to item's row without re-entering on_logs_selection_changed"""
+        index = self.logs_list.model().index(self.logs_list.row(item), 0)
+        self.logs_list.blockSignals(True)
+        try:
+            self.logs_list.selectionModel().select(index, command)
+        finally:
+            self.logs_list.blockSignals(False)
+
+    def on_log_selected(self, log_name):
+        """Make log_name the current log"""
+
+        # Update current log (a new df also invalidates the cached column index)
         self.current_log = self.loaded_logs[log_name]
         self.df = self.current_log
+        self._col_index = None
         self.selected_logs = [log_name]
         
         # Only notify parent for non-Time Domain tabs
@@ -909,15 +1132,24 @@ class FeatureSelectionWidget(QWidget):
         if current_tab != 0:  # Don't auto-plot in Time Domain tab
             self.notify_parent_update(None)
 
+    def _dispatch_log_selection(self):
+        """Route log selection changes to the limit check of the current tab"""
+        tab = self.get_current_tab_index()
+        if tab == 1:
+            self._handle_spectral_log_selection()
+        elif tab == 2:
+            self._handle_step_response_log_selection()
+
     def _handle_step_response_log_selection(self):
         """Handle log selection changes in step response mode"""
         if not hasattr(self, 'step_response_mode') or not self.step_response_mode:
             return
             
-        selected_items = self.logs_list.selectedItems()
-        if len(selected_items) > 5:
+        # Count on the selection model; only the offending row is ever turned into an item
+        selected_indexes = self.logs_list.selectionModel().selectedIndexes()
+        if len(selected_indexes) > 5:
             # Unselect the last selected item
-            selected_items[-1].setSelected(False)
+            self.logs_list.item(selected_indexes[-1].row()).setSelected(False)
             QMessageBox.warning(self, "Warning", "You can only select up to 5 flights for step response analysis.")
 
     def _handle_spectral_log_selection(self):
@@ -925,78 +1157,31 @@ class FeatureSelectionWidget(QWidget):
         if not hasattr(self, 'spectral_mode') or not self.spectral_mode:
             return
             
-        selected_items = self.logs_list.selectedItems()
-        if len(selected_items) > 2:
+        # Count on the selection model; only the offending row is ever turned into an item
+        selected_indexes = self.logs_list.selectionModel().selectedIndexes()
+        if len(selected_indexes) > 2:
             # Unselect the last selected item
-            selected_items[-1].setSelected(False)
+            self.logs_list.item(selected_indexes[-1].row()).setSelected(False)
             QMessageBox.warning(self, "Warning", "You can only select up to 2 flights for frequency domain.")
 
+    def _apply_debug_level(self):
+        """Cache the numeric debug level and sync the widget logger with it"""
+        self._debug_level_num = _DEBUG_LEVELS.get(self.debug_level, 1)
+        self._log.setLevel(logging.DEBUG if self._debug_level_num >= 2 else logging.INFO)
+
     def debug(self, level):
-        levels = {"INFO": 1, "DEBUG": 2, "VERBOSE": 3}
-        return levels.get(getattr(self, 'debug_level', 'INFO'), 1) >= levels.get(level, 1)
+        # Called from every plotting path, so compare against the level cached by _apply_debug_level
+        return self._debug_level_num >= _DEBUG_LEVELS.get(level, 1)
 
     def check_missing_features(self):
         """Check if selected checkboxes have corresponding data in the current log and show warnings"""
         if not hasattr(self, 'df') or self.df is None:
             return
             
-        missing_features = []
-        
-        # Check gyro data
-        if self.gyro_unfilt_checkbox.isChecked():
-            gyro_unfilt_cols = [col for col in self.df.columns if 'gyrounfilt' in col.lower()]
-            if not gyro_unfilt_cols:
-                missing_features.append("Gyro (raw)")
-                
-        if self.gyro_scaled_checkbox.isChecked():
-            gyro_scaled_cols = [col for col in self.df.columns if 'gyroadc' in col.lower() and '(deg/s)' in col]
-            if not gyro_scaled_cols:
-                missing_features.append("Gyro (filtered)")
-        
-        # Check PID data
-        if self.pid_p_checkbox.isChecked():
-            pid_p_cols = [col for col in self.df.columns if 'axisp' in col.lower()]
-            if not pid_p_cols:
-                missing_features.append("P-Term")
-                
-        if self.pid_i_checkbox.isChecked():
-            pid_i_cols = [col for col in self.df.columns if 'axisi' in col.lower()]
-            if not pid_i_cols:
-                missing_features.append("I-Term")
-                
-        if self.pid_d_checkbox.isChecked():
-            pid_d_cols = [col for col in self.df.columns if 'axisd' in col.lower()]
-            if not pid_d_cols:
-                missing_features.append("D-Term")
-                
-        if self.pid_f_checkbox.isChecked():
-            pid_f_cols = [col for col in self.df.columns if 'axisf' in col.lower()]
-            if not pid_f_cols:
-                missing_features.append("FeedForward")
-        
-        # Check Setpoint data
-        if self.setpoint_checkbox.isChecked():
-            setpoint_cols = [col for col in self.df.columns if 'setpoint' in col.lower()]
-            if not setpoint_cols:
-                missing_features.append("Setpoint")
-        
-        # Check RC data
-        if self.rc_checkbox.isChecked():
-            rc_cols = [col for col in self.df.columns if 'rccommand' in col.lower() and '[3]' not in col]
-            if not rc_cols:
-                missing_features.append("RC Commands")
-        
-        # Check Throttle data
-        if self.throttle_checkbox.isChecked():
-            throttle_cols = [col for col in self.df.columns if 'rccommand[3]' in col.lower()]
-            if not throttle_cols:
-                missing_features.append("Throttle")
-        
-        # Check Motor Outputs
-        if self.motor_checkbox.isChecked():
-            motor_cols = [col for col in self.df.columns if col.lower().startswith('motor[')]
-            if not motor_cols:
-                missing_features.append("Motor Outputs")
+        # Same per-df column buckets as get_selected_features, so repeated checks never rescan the columns
+        index = self._column_index()
+        missing_features = [label for checkbox, key, label in self._feature_columns
+                            if checkbox.isChecked() and not index[key]]
         
         # Show warning if any features are missing
         if missing_features:
@@ -1075,6 +1260,8 @@ class SpectralAnalyzerWidget(QWidget):
         self.original_heights = {}  # Store original heights for restoration
         self.setup_ui()
         self.log_count = 0  # Track number of logs plotted
+        self._series_pool = {}  # (axis_idx, type, log slot) -> (full, zoom) series reused across updates
+        self._active_series = set()  # Pooled series refilled since the last clear
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -1101,7 +1288,13 @@ class SpectralAnalyzerWidget(QWidget):
         smoothing_layout.addWidget(max_label)
         smoothing_layout.addWidget(self.window_size_slider)
         smoothing_layout.addWidget(min_label)
-        self.window_size_slider.valueChanged.connect(lambda _: self.update_spectrum(self.df))
+        # Recompute only once a drag ends; wheel/key/click bursts are coalesced by _psd_timer
+        self._psd_timer = QTimer(self)
+        self._psd_timer.setSingleShot(True)
+        self._psd_timer.setInterval(150)
+        self._psd_timer.timeout.connect(lambda: self.update_spectrum(self.df))
+        self.window_size_slider.valueChanged.connect(self.on_window_size_changed)
+        self.window_size_slider.sliderReleased.connect(self._on_window_size_released)
         smoothing_group.setLayout(smoothing_layout)
         layout.addWidget(smoothing_group)
 
@@ -1114,6 +1307,7 @@ class SpectralAnalyzerWidget(QWidget):
             row_layout = QHBoxLayout()
             # Full range plot
             chart_view_full = ClickableChartView()
+            chart_view_full.enable_opengl()
             chart_view_full.setRenderHint(QPainter.Antialiasing)
             chart_view_full.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             chart_view_full.setMinimumHeight(200)
@@ -1125,13 +1319,16 @@ class SpectralAnalyzerWidget(QWidget):
             chart_full.legend().setVisible(True)
             chart_full.setMargins(QMargins(10, 10, 10, 10))
             chart_view_full.setChart(chart_full)
+            chart_view_full.create_track_line()
             chart_view_full.setMouseTracking(True)
             chart_view_full.mouseMoveEvent = lambda event, cv=chart_view_full: self.show_tooltip(event, cv)
             chart_view_full.setCursor(Qt.CrossCursor)  # Add crosshair cursor
             chart_view_full.clicked.connect(lambda cv=chart_view_full: self.on_chart_clicked(cv))
+            chart_view_full.resized.connect(partial(self._refill_m4, chart_view_full))
             row_layout.addWidget(chart_view_full, stretch=3)  # Make full plot wider
             # Zoomed plot (0-100 Hz)
             chart_view_zoom = ClickableChartView()
+            chart_view_zoom.enable_opengl()
             chart_view_zoom.setRenderHint(QPainter.Antialiasing)
             chart_view_zoom.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             chart_view_zoom.setMinimumHeight(200)
@@ -1142,16 +1339,36 @@ class SpectralAnalyzerWidget(QWidget):
             chart_zoom.legend().setVisible(True)
             chart_zoom.setMargins(QMargins(10, 10, 10, 10))
             chart_view_zoom.setChart(chart_zoom)
+            chart_view_zoom.create_track_line()
             chart_view_zoom.setMouseTracking(True)
             chart_view_zoom.mouseMoveEvent = lambda event, cv=chart_view_zoom: self.show_tooltip(event, cv)
             chart_view_zoom.setCursor(Qt.CrossCursor)  # Add crosshair cursor
             chart_view_zoom.clicked.connect(lambda cv=chart_view_zoom: self.on_chart_clicked(cv))
+            chart_view_zoom.resized.connect(partial(self._refill_m4, chart_view_zoom))
             row_layout.addWidget(chart_view_zoom, stretch=1)  # Make zoomed plot narrower
             # Store both views as a tuple
             self.chart_views.append((chart_view_full, chart_view_zoom))
             charts_layout.addLayout(row_layout)
         layout.addWidget(self.charts_container)
 
+    def on_window_size_changed(self, value):
+        """Schedule a spectrum update for non-drag slider changes."""
+        self.window_size_slider.setToolTip(f"Window size: {self.window_sizes[value]}")
+        if not self.window_size_slider.isSliderDown():
+            self._psd_timer.start()
+
+    def _refill_m4(self, chart_view):
+        """Re-reduce PSD series that were reduced for a narrower chart than chart_view is now."""
+        n_buckets = _m4_buckets(chart_view)
+        for series in chart_view.chart().series():
+            if getattr(series, '_freqs', None) is not None and getattr(series, '_m4_buckets', 0) < n_buckets:
+                _m4_fill(series, n_buckets)
+
+    def _on_window_size_released(self):
+        """Update the spectrum right away when a drag ends."""
+        self._psd_timer.stop()
+        self.update_spectrum(self.df)
+
     def on_chart_clicked(self, clicked_chart_view):
         """Handle chart click to expand or restore."""
         # If the clicked chart is already expanded, restore all
@@ -1204,12 +1421,44 @@ class SpectralAnalyzerWidget(QWidget):
             font.setBold(True)
         return font
 
+    def _get_sampling_rate(self, df):
+        """Return the sampling rate of df, cached per dataframe."""
+        if getattr(self, '_fs_cache_df', None) is df:
+            return self._fs_cache
+        time_data = df['time'].to_numpy(copy=False)
+        # Unit detection and the endpoint dt live in spectral_utils.sampling_rate
+        fs = sampling_rate(time_data)
+        if self.feature_widget.debug('VERBOSE') and len(time_data) >= 2:
+            # Compare in raw time units, so no unit scale is needed here
+            endpoint_dt = (float(time_data[-1]) - float(time_data[0])) / (len(time_data) - 1)
+            median_dt = float(np.median(np.diff(time_data.astype(float, copy=False))))
+            if not np.isclose(endpoint_dt, median_dt, rtol=1e-3):
+                print(f"[DEBUG][SpectralAnalyzer] Non-uniform sampling: endpoint dt={endpoint_dt:.6g}, median dt={median_dt:.6g} (raw units)")
+        self._fs_cache = fs
+        self._fs_cache_df = df
+        return self._fs_cache
+
+    def _get_pooled_series(self, axis_idx, type_key):
+        """Return the reusable (full, zoom) series pair for an axis, type and log slot."""
+        key = (axis_idx, type_key, self.log_count)
+        if key not in self._series_pool:
+            self._series_pool[key] = (QLineSeries(), QLineSeries())
+        return self._series_pool[key]
+
+    def _detach_inactive_series(self, axis_idx=None):
+        """Remove series that were not refilled since the last clear from the charts."""
+        active = self._active_series
+        views = self.chart_views if axis_idx is None else [self.chart_views[axis_idx]]
+        for full_view, zoom_view in views:
+            for chart in (full_view.chart(), zoom_view.chart()):
+                for series in chart.series():
+                    if series not in active:
+                        chart.removeSeries(series)
+
     def update_spectrum(self, df, log_label=None, clear_charts=True):
-        # Always clear all series before plotting new spectra (fix caching on smoothing change)
+        # Series are pooled and refilled in place; anything not refilled since the last clear is detached
         if clear_charts:
-            for (chart_view_full, chart_view_zoom) in self.chart_views:
-                chart_view_full.chart().removeAllSeries()
-                chart_view_zoom.chart().removeAllSeries()
+            self._active_series = set()
             self.log_count = 0  # Reset log count when clearing charts
         else:
             self.log_count += 1  # Increment log count for additional logs
@@ -1222,108 +1471,91 @@ class SpectralAnalyzerWidget(QWidget):
         df = self.df
         if df is None or df.empty:
             print("[INFO][SpectralAnalyzer] DataFrame is empty or None.")
+            self._detach_inactive_series()
             return
         # Welch parameters from user controls
         window_size = self.window_sizes[self.window_size_slider.value()]
-        window_type = 'hann'  # Fixed
         overlap = 0.5        # Fixed (50%)
 
         # Determine which types are selected (Gyro raw, Gyro filtered, PID, Setpoint, RC Command)
-        selected_types = []
-        fw = self.feature_widget
-        if hasattr(fw, 'gyro_unfilt_checkbox') and fw.gyro_unfilt_checkbox.isChecked():
-            selected_types.append('raw')
-        if hasattr(fw, 'gyro_scaled_checkbox') and fw.gyro_scaled_checkbox.isChecked():
-            selected_types.append('filtered')
-        if hasattr(fw, 'pid_p_checkbox') and fw.pid_p_checkbox.isChecked():
-            selected_types.append('pterm')
-        if hasattr(fw, 'pid_i_checkbox') and fw.pid_i_checkbox.isChecked():
-            selected_types.append('iterm')
-        if hasattr(fw, 'pid_d_checkbox') and fw.pid_d_checkbox.isChecked():
-            selected_types.append('dterm')
-        if hasattr(fw, 'setpoint_checkbox') and fw.setpoint_checkbox.isChecked():
-            selected_types.append('setpoint')
-        if hasattr(fw, 'rc_checkbox') and fw.rc_checkbox.isChecked():
-            selected_types.append('rc')
+        mask = getattr(self.feature_widget, '_feature_mask', 0)
+        selected_types = [t for t, bit in _SPECTRAL_TYPE_BITS if mask & bit]
         if not selected_types:
             print("[INFO][SpectralAnalyzer] No types selected, nothing will be plotted.")
+            self._detach_inactive_series()
             return
         if self.feature_widget.debug('INFO'):
             print(f"[INFO][SpectralAnalyzer] Selected types: {selected_types}")
 
-        # Select color palette based on whether to use alternative colors
-        color_palette = ALTERNATIVE_COLOR_PALETTE if use_alternative_colors else COLOR_PALETTE
-
-        # Map type to column patterns, legend, and color
-        type_to_pattern = {
-            'raw': ('gyroUnfilt[{}]', 'Gyro (raw)', QColor(*color_palette.get('Gyro (raw)', (255, 0, 255)))),
-            'filtered': ('gyroADC[{}] (deg/s)', 'Gyro (filtered)', QColor(*color_palette.get('Gyro (filtered)', (0, 255, 255)))),
-            'pterm': ('axisP[{}]', 'P-Term', QColor(*color_palette.get('P-Term', (255, 200, 0)))),
-            'iterm': ('axisI[{}]', 'I-Term', QColor(*color_palette.get('I-Term', (255, 128, 0)))),
-            'dterm': ('axisD[{}]', 'D-Term', QColor(*color_palette.get('D-Term', (128, 0, 255)))),
-            'setpoint': ('setpoint[{}]', 'Setpoint', QColor(*color_palette.get('Setpoint', (0, 0, 0)))),
-            'rc': ('rcCommand[{}]', 'RC Command', QColor(*color_palette.get('RC Command', (128, 128, 0)))),
-        }
+        # Column patterns, legend labels and colors, with the alternative palette for the second log
+        type_to_pattern = _SPECTRAL_TYPES_ALT if use_alternative_colors else _SPECTRAL_TYPES
         axis_names = ['Roll', 'Pitch', 'Yaw']
         axis_indices = [0, 1, 2]
 
-        time_data = df['time'].values.astype(float)
-        if time_data.max() > 1e6:
-            time_data = time_data / 1_000_000.0
-        elif time_data.max() > 1e3:
-            time_data = time_data / 1_000.0
-        time_data = time_data - time_data.min()
-        dt = np.mean(np.diff(time_data))
-        fs = 1.0 / dt if dt > 0 else 0.0
+        fs = self._get_sampling_rate(df)
         if self.feature_widget.debug('INFO'):
             print(f"[INFO][SpectralAnalyzer] Sampling rate: {fs:.2f} Hz")
 
-        from scipy import signal
+        # Resolve the (type, column) pairs present for each axis once, up front
+        columns = set(df.columns)
+        plan = []
+        for axis_idx in axis_indices:
+            col_names = [(t, type_to_pattern[t][0].format(axis_idx)) for t in selected_types]
+            plan.append([(t, col_name) for t, col_name in col_names if col_name in columns])
 
         legend_labels = set()
         plotted_types = set()
-        for axis_idx, axis_name in enumerate(['Roll', 'Pitch', 'Yaw']):
+        for axis_idx, axis_name in enumerate(axis_names):
             chart_full = self.chart_views[axis_idx][0].chart()
             chart_zoom = self.chart_views[axis_idx][1].chart()
             chart_full.legend().setVisible(False)
             chart_zoom.legend().setVisible(False)
             series_list = []
+            # Compute the PSDs of all selected columns for this axis in one batch
+            axis_plan = plan[axis_idx]
+            psd_by_type = {}
+            if axis_plan and len(df) >= 2:
+                # float32 is plenty for a dB-scale PSD and halves the FFT buffer size
+                batch_data = np.vstack([df[col_name].to_numpy(dtype=np.float32, copy=False) for _, col_name in axis_plan])
+                freqs, psd_batch = welch_batch(batch_data, fs, window_size, int(window_size * overlap))
+                psd_by_type = dict(zip([t for t, _ in axis_plan], psd_batch))
             for t in selected_types:
                 pattern, label, color = type_to_pattern[t]
-                col_name = pattern.format(axis_idx)
-                if col_name in df.columns:
-                    axis_data = df[col_name].values
-                    if len(axis_data) < 2:
-                        continue
-                    nperseg = window_size
-                    noverlap = int(window_size * overlap)
-                    freqs, psd = signal.welch(axis_data, fs=fs, nperseg=nperseg, window=window_type, noverlap=noverlap, scaling='density')
-                    psd_db = 10 * np.log10(psd + 1e-10)
+                if t in psd_by_type:
+                    psd_db = 10 * np.log10(psd_by_type[t] + 1e-10)
+                    series_full, series_zoom = self._get_pooled_series(axis_idx, t)
                     # Full range series
-                    series_full = QLineSeries()
                     # Add log label to series name if provided
                     series_name = label
                     if log_label:
                         series_name = f"{label} [{log_label}]"
                     series_full.setName(series_name)
-                    for f, p in zip(freqs, psd_db):
-                        series_full.append(f, p)
+                    # Keep the raw arrays around for fast tooltip lookups and later re-reduction
+                    series_full._freqs = freqs
+                    series_full._psd_db = psd_db
+                    # Only a few points per pixel column are visible, so plot the M4 reduction
+                    # (re-reduced from the raw arrays when the chart grows or is exported)
+                    _m4_fill(series_full, _m4_buckets(self.chart_views[axis_idx][0]))
                     pen = series_full.pen()
                     pen.setColor(color)
                     pen.setWidthF(1.5)
                     series_full.setPen(pen)
-                    chart_full.addSeries(series_full)
+                    if series_full.chart() is None:
+                        chart_full.addSeries(series_full)
                     # Zoomed series (0-100 Hz)
-                    series_zoom = QLineSeries()
                     series_zoom.setName(series_name)
-                    for f, p in zip(freqs, psd_db):
-                        if f <= 100:
-                            series_zoom.append(f, p)
+                    # freqs is sorted, so the 0-100 Hz band is a prefix slice (a view, no mask copy)
+                    n_zoom = int(np.searchsorted(freqs, 100.0, side='right'))
+                    series_zoom._freqs = freqs[:n_zoom]
+                    series_zoom._psd_db = psd_db[:n_zoom]
+                    _m4_fill(series_zoom, _m4_buckets(self.chart_views[axis_idx][1]))
                     pen_zoom = series_zoom.pen()
                     pen_zoom.setColor(color)
                     pen_zoom.setWidthF(1.5)
                     series_zoom.setPen(pen_zoom)
-                    chart_zoom.addSeries(series_zoom)
+                    if series_zoom.chart() is None:
+                        chart_zoom.addSeries(series_zoom)
+                    self._active_series.update((series_full, series_zoom))
                     series_list.append(series_full)
                     # For the legend, include the log name and label
                     if log_label:
@@ -1331,6 +1563,7 @@ class SpectralAnalyzerWidget(QWidget):
                     else:
                         legend_labels.add((label, color.name(), None))
                     plotted_types.add(t)
+            self._detach_inactive_series(axis_idx)
             # Axes for full range
             chart_full.createDefaultAxes()
             axes_x_full = chart_full.axes(Qt.Horizontal)
@@ -1386,10 +1619,7 @@ class SpectralAnalyzerWidget(QWidget):
         if legend_layout is not None:
             # Only clear legend if we're on the first log
             if clear_charts:
-                while legend_layout.count():
-                    item = legend_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
+                self.feature_widget.clear_legend()
             # Sort legend entries by label then by log_label for consistent display
             sorted_labels = sorted(legend_labels, key=lambda x: (x[0], str(x[2]) if x[2] else ""))
             # Determine if we are plotting multiple logs
@@ -1408,10 +1638,23 @@ class SpectralAnalyzerWidget(QWidget):
                 else:
                     legend_text = f"<span style='color: {color_name}'>●</span> {label}"
                 legend_label.setText(legend_text)
-                legend_label.setStyleSheet("background: none;")
                 legend_layout.addWidget(legend_label)
 
     def show_tooltip(self, event, chart_view):
+        """Queue a tooltip update, coalescing mouse moves to at most one per frame."""
+        # Qt reuses the event object, so keep copies of the positions only
+        self._pending_tooltip = (chart_view, QPointF(event.position()), QPoint(event.globalPos()))
+        if not getattr(self, '_tooltip_pending', False):
+            self._tooltip_pending = True
+            QTimer.singleShot(16, self._flush_tooltip)
+
+    def _flush_tooltip(self):
+        """Run the most recent queued tooltip update."""
+        self._tooltip_pending = False
+        chart_view, pos, global_pos = self._pending_tooltip
+        self._update_tooltip(chart_view, pos, global_pos)
+
+    def _update_tooltip(self, chart_view, pos, global_pos):
         chart = chart_view.chart()
         if not chart:
             return
@@ -1436,7 +1679,7 @@ class SpectralAnalyzerWidget(QWidget):
         # Map pixel to axis value
         if right - left == 0 or bottom - top == 0:
             return
-        freq_val = x_min + (x_max - x_min) * (event.position().x() - left) / (right - left)
+        freq_val = x_min + (x_max - x_min) * (pos.x() - left) / (right - left)
         
         # Update all charts with the same frequency line
         for full_view, zoom_view in self.chart_views:
@@ -1452,20 +1695,9 @@ class SpectralAnalyzerWidget(QWidget):
                 view_top = view_plot_area.top()
                 view_bottom = view_plot_area.bottom()
                 
-                # Calculate X position in scene coordinates for this chart
-                view_x_scene = view.mapToScene(view.mapFromGlobal(event.globalPos())).x()
-                
-                # Draw or update vertical line
-                scene = view.scene()
-                if not hasattr(view, '_track_line'):
-                    from PySide6.QtWidgets import QGraphicsLineItem
-                    view._track_line = QGraphicsLineItem()
-                    view._track_line.setZValue(1000)
-                    pen = view._track_line.pen()
-                    pen.setColor(QColor(255, 0, 0, 128))
-                    pen.setWidth(1)
-                    view._track_line.setPen(pen)
-                    scene.addItem(view._track_line)
+                # Calculate X position in scene coordinates for this chart. QChartView keeps its
+                # scene rect equal to the frameless viewport, so scene x is the widget-local x
+                view_x_scene = pos.x() if view is chart_view else view.mapFromGlobal(global_pos).x()
                 
                 # Show/hide line based on whether we're in the plot area
                 if view_left <= view_x_scene <= view_right:
@@ -1474,28 +1706,27 @@ class SpectralAnalyzerWidget(QWidget):
                 else:
                     view._track_line.setVisible(False)
         
+        # Only the hovered chart computes tooltip values, and only inside its plot area
+        if not left <= pos.x() <= right:
+            QToolTip.hideText()
+            return
         # Get all series data at the current frequency point
         tooltip_lines = [f"Frequency: {freq_val:.2f} Hz"]
-        all_series = chart.series()
-        for series in all_series:
-            # Find closest point to current frequency
-            closest_point = None
-            closest_dist = float('inf')
-            for i in range(series.count()):
-                point = series.at(i)
-                dist = abs(point.x() - freq_val)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_point = point
-            if closest_point and closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
+        for series in chart.series():
+            freqs = getattr(series, '_freqs', None)
+            if freqs is None or len(freqs) == 0:
+                continue
+            # Find closest point to current frequency (freqs are sorted)
+            idx = int(np.searchsorted(freqs, freq_val))
+            if idx > 0 and (idx == len(freqs) or abs(freqs[idx - 1] - freq_val) <= abs(freqs[idx] - freq_val)):
+                idx -= 1
+            closest_dist = abs(freqs[idx] - freq_val)
+            if closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
                 name = series.name()
-                value = closest_point.y()
+                value = series._psd_db[idx]
                 tooltip_lines.append(f"{name}: {value:.2f} dB")
         tooltip = "\n".join(tooltip_lines)
-        if left <= event.position().x() <= right:
-            QToolTip.showText(event.globalPos(), tooltip, chart_view)
-        else:
-            QToolTip.hideText()
+        QToolTip.showText(global_pos, tooltip, chart_view)
 
 class StepResponseWidget(QWidget):
     def __init__(self, feature_widget, parent=None):
@@ -1584,6 +1815,7 @@ class StepResponseWidget(QWidget):
         self.chart_views = []
         for axis in ['Roll', 'Pitch', 'Yaw']:
             chart_view = ClickableChartView()
+            chart_view.enable_opengl()
             chart_view.setRenderHint(QPainter.Antialiasing)
             chart_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             chart_view.setMinimumHeight(200)
@@ -1595,7 +1827,9 @@ class StepResponseWidget(QWidget):
             chart.legend().setVisible(False)  # Hide legend by default
             chart.setMargins(QMargins(10, 10, 10, 10))
             chart_view.setChart(chart)
+            self.setup_step_axes(chart_view)
             # Connect mouse move event for tooltips
+            chart_view.create_track_line()
             chart_view.setMouseTracking(True)
             chart_view.mouseMoveEvent = lambda event, cv=chart_view: self.show_tooltip(event, cv)
             chart_view.setCursor(Qt.CrossCursor)  # Add crosshair cursor
@@ -1607,6 +1841,40 @@ class StepResponseWidget(QWidget):
             charts_layout.addWidget(chart_view)
         layout.addWidget(self.charts_container)
 
+    def setup_step_axes(self, chart_view):
+        """Create the fixed step response axes for a chart view."""
+        chart = chart_view.chart()
+        axis_x = QValueAxis()
+        axis_x.setTitleText('Time (ms)')
+        axis_x.setRange(0, 500)
+        axis_x.setLabelFormat('%d')
+        axis_x.setTickCount(6)
+        axis_x.setTitleVisible(True)
+        axis_x.setLabelsVisible(True)
+        axis_x.setGridLineVisible(True)
+        axis_x.setLinePenColor(Qt.black)
+        axis_x.setLabelsColor(Qt.black)
+        axis_x.setTitleFont(self.create_font('label'))
+        axis_x.setLabelsFont(self.create_font('label'))
+        # Use QCategoryAxis for Y axis to guarantee ticks at 0, 0.25, ..., 1.75
+        axis_y = QCategoryAxis()
+        axis_y.setTitleText('Response')
+        axis_y.setRange(0., 1.75)
+        axis_y.setLabelsPosition(QCategoryAxis.AxisLabelsPositionOnValue)
+        for v in [0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75]:
+            axis_y.append(f'{v:.2f}', v)
+        axis_y.setTitleVisible(True)
+        axis_y.setLabelsVisible(True)
+        axis_y.setGridLineVisible(True)
+        axis_y.setLinePenColor(Qt.black)
+        axis_y.setLabelsColor(Qt.black)
+        axis_y.setTitleFont(self.create_font('label'))
+        axis_y.setLabelsFont(self.create_font('label'))
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        chart_view._step_axis_x = axis_x
+        chart_view._step_axis_y = axis_y
+
     def on_chart_clicked(self, clicked_chart_view):
         """Handle chart click to expand or restore."""
         # If the clicked chart is already expanded, restore all
@@ -1655,6 +1923,7 @@ class StepResponseWidget(QWidget):
                     proxy.setPos(chart_view.width() - 400, y_offset)
 
     def update_step_response(self, df, line_width=None, log_name=None, clear_charts=True, log_index=0):
+        from utils.step_trace import StepTrace  # scipy-backed, only needed once a step response is shown
         if df is None or df.empty:
             print('[StepResponseWidget] DataFrame is empty or None.')
             return
@@ -1683,55 +1952,17 @@ class StepResponseWidget(QWidget):
                 parent = parent.parent()
             if parent and hasattr(parent, 'current_file') and parent.current_file:
                 log_name = os.path.basename(parent.current_file)
-        # Optional: Decimate data for speed if very large
-        if len(df) > 20000:
-            df = df.iloc[::2].reset_index(drop=True)
-        from utils.config import MOTOR_COLORS
+        # Optional: Decimate data for speed if very large (strided views, no dataframe copy)
+        stride = 2 if len(df) > 20000 else 1
         for i, axis_name in enumerate(axes_names):
             chart_view = self.charts_container.layout().itemAt(i).widget() if hasattr(self, 'charts_container') else self.chart_views[i]
             chart = chart_view.chart()
             if clear_charts:
                 chart.legend().setVisible(True)  # Show legend
                 chart.setTitle(f"{axis_name.capitalize()} Step Response")
-                # Remove all existing axes before adding new ones (only if clear_charts)
-                for axis in chart.axes():
-                    chart.removeAxis(axis)
-                # Set up axes
-                axis_x = QValueAxis()
-                axis_x.setTitleText('Time (ms)')
-                axis_x.setRange(0, 500)
-                axis_x.setLabelFormat('%d')
-                axis_x.setTickCount(6)
-                axis_x.setTitleVisible(True)
-                axis_x.setLabelsVisible(True)
-                axis_x.setGridLineVisible(True)
-                axis_x.setLinePenColor(Qt.black)
-                axis_x.setLabelsColor(Qt.black)
-                axis_x.setTitleFont(self.create_font('label'))
-                axis_x.setLabelsFont(self.create_font('label'))
-                # Use QCategoryAxis for Y axis to guarantee ticks at 0, 0.25, ..., 1.75
-                axis_y = QCategoryAxis()
-                axis_y.setTitleText('Response')
-                axis_y.setRange(0., 1.75)
-                axis_y.setLabelsPosition(QCategoryAxis.AxisLabelsPositionOnValue)
-                for v in [0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75]:
-                    axis_y.append(f'{v:.2f}', v)
-                axis_y.setTitleVisible(True)
-                axis_y.setLabelsVisible(True)
-                axis_y.setGridLineVisible(True)
-                axis_y.setLinePenColor(Qt.black)
-                axis_y.setLabelsColor(Qt.black)
-                axis_y.setTitleFont(self.create_font('label'))
-                axis_y.setLabelsFont(self.create_font('label'))
-                chart.addAxis(axis_x, Qt.AlignBottom)
-                chart.addAxis(axis_y, Qt.AlignLeft)
-                chart_view._step_axis_x = axis_x
-                chart_view._step_axis_y = axis_y
-            else:
-                axis_x = getattr(chart_view, '_step_axis_x', None)
-                axis_y = getattr(chart_view, '_step_axis_y', None)
-                if axis_x is None or axis_y is None:
-                    continue
+            # Axes are created once in setup_ui and reused across updates
+            axis_x = chart_view._step_axis_x
+            axis_y = chart_view._step_axis_y
 
             # Find columns
             gyro_col = f'gyroADC[{i}] (deg/s)'
@@ -1768,10 +1999,10 @@ class StepResponseWidget(QWidget):
                 dmin_val = 0.0
 
             if gyro_col in df.columns and p_err_col in df.columns and throttle_col in df.columns:
-                time = df['time'].values
-                gyro = df[gyro_col].values
-                p_err = df[p_err_col].values
-                throttle = df[throttle_col].values
+                time = df['time'].to_numpy(copy=False)[::stride]
+                gyro = df[gyro_col].to_numpy(copy=False)[::stride]
+                p_err = df[p_err_col].to_numpy(copy=False)[::stride]
+                throttle = df[throttle_col].to_numpy(copy=False)[::stride]
                 try:
                     pid_p = float(str(pid_val).split(',')[0]) if pid_val is not None and pid_val != 'N/A' else 1.0
                 except Exception:
@@ -1811,11 +2042,13 @@ class StepResponseWidget(QWidget):
                 # Step response mean line (add after, so it's on top)
                 color = QColor(*MOTOR_COLORS[log_index % len(MOTOR_COLORS)])
                 series = QLineSeries()
-                t_ms = [float(x) * 1000 for x in t]
-                t_ms = [x - t_ms[0] for x in t_ms]
+                t_ms = (np.asarray(t, dtype=float) - t[0]) * 1000.0
                 mean = list(mean)
-                for x, y in zip(t_ms, mean):
-                    series.append(x, y)
+                # Fill the series in a single call rather than one append per sample
+                series.replace([QPointF(float(x), float(y)) for x, y in zip(t_ms, mean)])
+                # Keep the samples as arrays for the hovered-chart tooltip lookup
+                series._xs = t_ms
+                series._ys = np.asarray(mean, dtype=float)
                 series.setName(f"{log_name}")
                 pen = series.pen()
                 pen.setColor(color)
@@ -1905,6 +2138,8 @@ class StepResponseWidget(QWidget):
             return
         t_val = x_min + (x_max - x_min) * (event.position().x() - left) / (right - left)
         
+        pos_x = event.position().x()
+        global_pos = event.globalPos()
         # Update all charts with the same time line
         for view in self.chart_views:
             view_chart = view.chart()
@@ -1918,20 +2153,9 @@ class StepResponseWidget(QWidget):
             view_top = view_plot_area.top()
             view_bottom = view_plot_area.bottom()
             
-            # Calculate X position in scene coordinates for this chart
-            view_x_scene = view.mapToScene(view.mapFromGlobal(event.globalPos())).x()
-            
-            # Draw or update vertical line
-            scene = view.scene()
-            if not hasattr(view, '_track_line'):
-                from PySide6.QtWidgets import QGraphicsLineItem
-                view._track_line = QGraphicsLineItem()
-                view._track_line.setZValue(1000)
-                pen = view._track_line.pen()
-                pen.setColor(QColor(255, 0, 0, 128))
-                pen.setWidth(1)
-                view._track_line.setPen(pen)
-                scene.addItem(view._track_line)
+            # Calculate X position in scene coordinates for this chart. QChartView keeps its
+            # scene rect equal to the frameless viewport, so scene x is the widget-local x
+            view_x_scene = pos_x if view is chart_view else view.mapFromGlobal(global_pos).x()
             
             # Show/hide line based on whether we're in the plot area
             if view_left <= view_x_scene <= view_right:
@@ -1940,28 +2164,27 @@ class StepResponseWidget(QWidget):
             else:
                 view._track_line.setVisible(False)
         
+        # Only the hovered chart computes tooltip values, and only inside its plot area
+        if not left <= event.position().x() <= right:
+            QToolTip.hideText()
+            return
         # Get all series data at the current time point
         tooltip_lines = [f"Time: {t_val:.1f} ms"]
-        all_series = chart.series()
-        for series in all_series:
-            # Find closest point to current time
-            closest_point = None
-            closest_dist = float('inf')
-            for i in range(series.count()):
-                point = series.at(i)
-                dist = abs(point.x() - t_val)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_point = point
-            if closest_point and closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
+        for series in chart.series():
+            xs = getattr(series, '_xs', None)
+            if xs is None or len(xs) == 0:
+                continue
+            # Find closest point to current time (xs is sorted)
+            idx = int(np.searchsorted(xs, t_val))
+            if idx > 0 and (idx == len(xs) or abs(xs[idx - 1] - t_val) <= abs(xs[idx] - t_val)):
+                idx -= 1
+            closest_dist = abs(xs[idx] - t_val)
+            if closest_dist < (x_max - x_min) / 100:  # Only show if reasonably close
                 name = series.name()
-                value = closest_point.y()
+                value = series._ys[idx]
                 tooltip_lines.append(f"{name}: {value:.2f}")
         tooltip = "\n".join(tooltip_lines)
-        if left <= event.position().x() <= right:
-            QToolTip.showText(event.globalPos(), tooltip, chart_view)
-        else:
-            QToolTip.hideText()
+        QToolTip.showText(event.globalPos(), tooltip, chart_view)
 
     def clear_all_charts_and_annotations(self):
         for chart_view in self.chart_views:
@@ -1985,6 +2208,31 @@ class StepResponseWidget(QWidget):
                 chart_view.chart().legend().setVisible(False)
                 chart_view.chart().update()
 
+class NoiseTaskSignals(QObject):
+    """Signals emitted by NoiseResultsTask."""
+    finished = Signal(int, object, int)
+    failed = Signal(int, str)
+
+class NoiseResultsTask(QRunnable):
+    """Compute noise analysis histograms off the GUI thread."""
+    def __init__(self, request_id, df, gain, max_freq):
+        super().__init__()
+        self.request_id = request_id
+        self.df = df
+        self.gain = gain
+        self.max_freq = max_freq
+        self.signals = NoiseTaskSignals()
+
+    def run(self):
+        try:
+            from utils.pid_analyzer_noise import compute_noise_results
+            results = compute_noise_results(self.df, gain=self.gain)
+            self.signals.finished.emit(self.request_id, results, self.max_freq)
+        except Exception as e:
+            # The traceback is only formatted if a handler emits the record
+            logger.exception("Noise analysis computation failed")
+            self.signals.failed.emit(self.request_id, str(e))
+
 class FrequencyAnalyzerWidget(QWidget):
     def __init__(self, feature_widget, parent=None):
         super().__init__(parent)
@@ -1992,6 +2240,9 @@ class FrequencyAnalyzerWidget(QWidget):
         self.df = None
         self.canvas = None
         self.gain = 5.0  # Default gain value
+        self._noise_request_id = 0  # Latest background noise computation
+        self._noise_task = None
+        self._canvas_pool = []  # FigureCanvases kept across refreshes; their figures are redrawn in place
         self.setup_ui()
 
     def setup_ui(self):
@@ -2034,12 +2285,11 @@ class FrequencyAnalyzerWidget(QWidget):
         # User needs to click "Show Plot" button to see the changes
 
     def clear_all_plots(self):
-        # Remove all canvases from the layout
+        # Remove all canvases from the layout; pooled canvases are kept for the next refresh
         if hasattr(self, 'canvas_list'):
             for canvas in self.canvas_list:
                 self.plot_layout.removeWidget(canvas)
                 canvas.setParent(None)
-                canvas.deleteLater()
             self.canvas_list = []
         else:
             self.canvas_list = []
@@ -2078,14 +2328,64 @@ class FrequencyAnalyzerWidget(QWidget):
                     else:
                         print(f"[FrequencyAnalyzer] Sample data for {col}:", values)
         self.clear_all_plots()
+        # Load the noise module (matplotlib, scipy) here on the GUI thread rather than in the worker
+        import utils.pid_analyzer_noise
+        # Compute the histograms on a worker thread; figures are built when the result arrives
+        self._noise_request_id += 1
+        self._noise_task = NoiseResultsTask(self._noise_request_id, self.df, self.gain, max_freq)
+        self._noise_task.signals.finished.connect(self._on_noise_results)
+        self._noise_task.signals.failed.connect(self._on_noise_failed)
+        QThreadPool.globalInstance().start(self._noise_task)
+
+    def _on_noise_motion(self, canvas, event):
+        """Show throttle/frequency under the cursor for a noise analysis canvas."""
+        fig = canvas.figure
+        # Get figure dimensions
+        fig_height = fig.get_figheight() * fig.dpi
+        # If position is near the bottom of the figure (where colorbar is), hide tooltip
+        # Colorbar is in the bottom ~5% of the figure
+        if event.y < fig_height * 0.05:
+            QToolTip.hideText()
+            return
+        # Hide tooltip if over colorbar or if no data coordinates
+        if (event.inaxes is None or
+            event.xdata is None or event.ydata is None or
+            event.inaxes is getattr(fig, 'noise_cbar_ax', None)):
+            QToolTip.hideText()
+            return
+        x, y = event.xdata, event.ydata
+        tooltip = f"Throttle: {x:.1f}%\nFrequency: {y:.1f} Hz"
+        QToolTip.showText(canvas.mapToGlobal(event.guiEvent.pos()), tooltip, canvas)
+
+    def _on_noise_failed(self, request_id, message):
+        """Report a failed background noise computation."""
+        if request_id == self._noise_request_id:
+            print(f"[FrequencyAnalyzer] Error plotting: {message}")
+
+    def _on_noise_results(self, request_id, results, max_freq):
+        """Build canvases for the latest background noise computation."""
+        # Ignore results superseded by a newer request
+        if request_id != self._noise_request_id:
+            return
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.collections import QuadMesh
+        from utils.pid_analyzer_noise import build_noise_figures
+        self.clear_all_plots()
         try:
-            figures = generate_individual_noise_figures(self.df, gain=self.gain, max_freq=max_freq)
+            # Redraw into the pooled canvas' figure instead of building a new canvas
+            pooled_fig = self._canvas_pool[0].figure if self._canvas_pool else None
+            figures = build_noise_figures(results, max_freq=max_freq, fig=pooled_fig)
             self.canvas_list = []
             # Arrange in 3x3 grid: rows=roll/pitch/yaw, cols=gyro/debug
             for i, fig in enumerate(figures):
-                canvas = FigureCanvas(fig)
-                # Set cursor to crosshair for better precision
-                canvas.setCursor(Qt.CrossCursor)
+                reused = i < len(self._canvas_pool) and self._canvas_pool[i].figure is fig
+                if reused:
+                    canvas = self._canvas_pool[i]
+                else:
+                    canvas = FigureCanvas(fig)
+                    # Set cursor to crosshair for better precision
+                    canvas.setCursor(Qt.CrossCursor)
+                    self._canvas_pool.append(canvas)
                 row = i // 3
                 if i % 3 == 0:
                     col = 0  # Gyro
@@ -2095,46 +2395,36 @@ class FrequencyAnalyzerWidget(QWidget):
                     col = 2  # D-term
                 self.plot_layout.addWidget(canvas, row, col)
                 self.canvas_list.append(canvas)
-                # Add tooltip support
-                def make_motion_event_handler(canvas, fig):
-                    def on_motion(event):
-                        # Get figure dimensions
-                        fig_height = fig.get_figheight() * fig.dpi
-                        # If position is near the bottom of the figure (where colorbar is), hide tooltip
-                        # Colorbar is in the bottom ~5% of the figure
-                        if event.y < fig_height * 0.05:
-                            QToolTip.hideText()
-                            return
-                        # Hide tooltip if over colorbar or if no data coordinates
-                        if (event.inaxes is None or
-                            event.xdata is None or event.ydata is None or
-                            (hasattr(event.inaxes, 'get_label') and event.inaxes.get_label() == 'colorbar')):
-                            QToolTip.hideText()
-                            return
-                        x, y = event.xdata, event.ydata
-                        tooltip = f"Throttle: {x:.1f}%\nFrequency: {y:.1f} Hz"
-                        QToolTip.showText(canvas.mapToGlobal(event.guiEvent.pos()), tooltip, canvas)
-                    return on_motion
                 # Add statistics annotation to the plot
+                cbar_ax = getattr(fig, 'noise_cbar_ax', None)
                 for ax in fig.axes:
-                    # Skip if this is a colorbar axis
-                    if ax.get_label() == 'colorbar':
+                    # Skip the colorbar axis
+                    if ax is cbar_ax:
                         continue
-                    for artist in ax.get_children():
-                        if hasattr(artist, 'get_array') and hasattr(artist, 'get_facecolor'):  # QuadMesh
+                    # Heatmaps live in ax.collections; no need to walk every child artist
+                    for artist in ax.collections:
+                        if isinstance(artist, QuadMesh):
                             arr = artist.get_array()
                             if arr is not None and hasattr(arr, 'shape'):
-                                # Get frequency values from the plot
-                                y_lims = ax.get_ylim()
-                                y_data = np.linspace(y_lims[0], y_lims[1], arr.shape[0])
+                                # Frequency of each row: centres of the mesh's own (ny+1, nx+1, 2) vertex grid
+                                coords = artist.get_coordinates() if hasattr(artist, 'get_coordinates') else None
+                                if coords is not None and coords.shape[0] == arr.shape[0] + 1:
+                                    edges = coords[:, 0, 1]
+                                    y_data = 0.5 * (edges[:-1] + edges[1:])
+                                else:
+                                    y_lims = ax.get_ylim()
+                                    y_data = np.linspace(y_lims[0], y_lims[1], arr.shape[0])
                                 # Create mask for frequencies above 15Hz
                                 freq_mask = y_data >= 15
+                                if arr.ndim == 2:
+                                    freq_mask = freq_mask[:, None]
                                 # Calculate statistics only for frequencies above 15Hz
-                                # Remove any padding/background values (1e-6)
-                                noise_values = arr[freq_mask][arr[freq_mask] > 1e-6]
-                                if len(noise_values) > 0:
-                                    mean_val = np.mean(noise_values)
-                                    peak_val = np.max(noise_values)
+                                # Remove any padding/background values (1e-6) and masked cells, in one mask
+                                values = np.ma.getdata(arr)
+                                mask = freq_mask & (values > 1e-6) & ~np.ma.getmaskarray(arr)
+                                if mask.any():
+                                    mean_val = np.mean(values, where=mask)
+                                    peak_val = np.max(values, where=mask, initial=-np.inf)
                                     # Add text annotation
                                     ax.text(0.98, 0.98, 
                                            f"Mean: {mean_val:.2f}\nPeak: {peak_val:.2f}",
@@ -2143,13 +2433,16 @@ class FrequencyAnalyzerWidget(QWidget):
                                            horizontalalignment='right',
                                            color='white',
                                            fontsize=9)
-                canvas.mpl_connect('motion_notify_event', make_motion_event_handler(canvas, fig))
+                # Add tooltip support; drop any previous handler so they never accumulate
+                if getattr(canvas, '_motion_cid', None) is not None:
+                    canvas.mpl_disconnect(canvas._motion_cid)
+                canvas._motion_cid = canvas.mpl_connect('motion_notify_event', partial(self._on_noise_motion, canvas))
+                if reused:
+                    canvas.draw_idle()
             if self.feature_widget.debug('DEBUG'):
                 print(f"[FrequencyAnalyzer] Individual plots generated successfully in 3x3 grid (max freq: {max_freq}Hz)")
-        except Exception as e:
-            import traceback
-            print(f"[FrequencyAnalyzer] Error plotting: {e}")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("[FrequencyAnalyzer] Error plotting")
 
     def create_font(self, font_type):
         font = QFont(FONT_CONFIG[font_type]['family'])
@@ -2158,12 +2451,57 @@ class FrequencyAnalyzerWidget(QWidget):
             font.setBold(True)
         return font 
 
+def write_export_jpeg(image, filepath, quality=None):
+    """Write an export image as JPEG with the configured quality and encoder options."""
+    # Encode into memory first, then write the file in one shot instead of many small buffered writes
+    data = QByteArray()
+    device = QBuffer(data)
+    device.open(QIODevice.WriteOnly)
+    writer = QImageWriter(device, b"jpg")
+    writer.setQuality(EXPORT_CONFIG['jpeg_quality'] if quality is None else quality)
+    writer.setOptimizedWrite(EXPORT_CONFIG['jpeg_optimize'])
+    writer.setProgressiveScanWrite(EXPORT_CONFIG['jpeg_progressive'])
+    ok = writer.write(image)
+    device.close()
+    if not ok:
+        print(f"[PlotExportWidget] Failed to encode {filepath}: {writer.errorString()}")
+        return False
+    try:
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(data.data())
+    except OSError as e:
+        print(f"[PlotExportWidget] Failed to write {filepath}: {e}")
+        return False
+    return True
+
+class ImageSaveSignals(QObject):
+    """Signals emitted by ImageSaveTask."""
+    finished = Signal(object, bool, str)
+
+class ImageSaveTask(QRunnable):
+    """Encode and write an export image off the GUI thread (QImage is safe to use from any thread)."""
+    def __init__(self, image, filepath, message, quality=EXPORT_CONFIG['jpeg_quality']):
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        self.message = message
+        self.quality = quality
+        self.signals = ImageSaveSignals()
+
+    def run(self):
+        ok = write_export_jpeg(self.image, self.filepath, self.quality)
+        self.signals.finished.emit(self, ok, self.message)
+
 class PlotExportWidget(QWidget):
+    _cached_fonts = {}  # (point size, bold) -> QFont for export painting, shared across exports
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         self.export_path = "/Users/jakubespandr/Desktop"
         self.previous_tab_index = 0  # Default to Time Domain
+        self._save_tasks = set()  # Keep pending save tasks (and their signals) alive
+        self._cached_canvas = None  # Last export canvas, reused for same-size exports
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -2240,18 +2578,9 @@ class PlotExportWidget(QWidget):
             self.status_label.setText(f"Error during export: {str(e)}")
     
     def _get_export_dir(self, parent):
-        # Try to get export_dir from settings.json in config folder
+        # Try to get export_dir from settings.json in config folder (cached)
         try:
-            import json
-            import os
-            app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            config_dir = os.path.join(app_dir, "config")
-            settings_path = os.path.join(config_dir, "settings.json")
-            export_dir = None
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    export_dir = settings.get('export_dir', None)
+            export_dir = _load_settings().get('export_dir', None)
             # Use export_dir from settings only if it is set and non-empty
             if export_dir and isinstance(export_dir, str) and export_dir.strip():
                 os.makedirs(export_dir, exist_ok=True)
@@ -2279,16 +2608,153 @@ class PlotExportWidget(QWidget):
             return parent.feature_widget.use_drone_in_filename
         return False
 
+    def _save_image_async(self, image, filepath, message):
+        """Queue a JPEG save on the thread pool; the status label is updated when it completes."""
+        # Hand the task its own QImage handle: with the share count above one, the next
+        # _export_canvas fill/paint detaches instead of overwriting pixels still being encoded
+        task = ImageSaveTask(QImage(image), filepath, message)
+        task.signals.finished.connect(self._on_image_saved)
+        self._save_tasks.add(task)
+        self.status_label.setText(f"Saving {os.path.basename(filepath)}...")
+        QThreadPool.globalInstance().start(task)
+
+    def _on_image_saved(self, task, ok, message):
+        """Report the result of a background image save."""
+        self._save_tasks.discard(task)
+        if ok:
+            self.status_label.setText(message)
+        else:
+            self.status_label.setText(f"Error saving {task.filepath}")
+
+    def _export_canvas(self, width, height):
+        """Return a white RGB32 export canvas, reusing the previous one when the size matches."""
+        canvas = self._cached_canvas
+        if canvas is None or canvas.width() != width or canvas.height() != height:
+            # RGB32 is the raster engine's native format: antialiased chart spans are
+            # blended in place rather than converted and stored back per span
+            canvas = QImage(width, height, QImage.Format_RGB32)
+            self._cached_canvas = canvas
+        # A pending save holds its own shallow copy (see _save_image_async), so this fill
+        # detaches from it instead of overwriting the image being encoded
+        canvas.fill(Qt.white)
+        return canvas
+
+    def _export_font(self, size, bold=True):
+        """Return a cached export font of the given point size."""
+        key = (size, bold)
+        font = self._cached_fonts.get(key)
+        if font is None:
+            font = QFont("fccTYPO", size)
+            font.setBold(bold)
+            self._cached_fonts[key] = font
+        return font
+
+    def _export_header_text(self, log_name, title, current_date, author_name, drone_name):
+        """Build the header line shared by the stacked exports."""
+        parts = [f"Log: {log_name}", title, f"Date: {current_date}"]
+        if author_name:
+            parts.append(f"Author: {author_name}")
+        if drone_name:
+            parts.append(f"Drone: {drone_name}")
+        return " | ".join(parts)
+
+    def _draw_centered_text(self, painter, text, font, width, y):
+        """Draw a plain-text line horizontally centered at y using a prepared QStaticText."""
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.setPerformanceHint(QStaticText.AggressiveCaching)
+        static.prepare(painter.transform(), font)
+        painter.setFont(font)
+        painter.drawStaticText(int((width - static.size().width()) / 2), y, static)
+
+    def _render_export_header(self, painter, width, header_height, scale_factor, header_text, settings_text=None):
+        """Draw the shaded header band and optional settings line of an export image."""
+        painter.setPen(QColor(0, 0, 0))
+        painter.fillRect(QRect(0, 0, width, header_height), QColor(230, 230, 240))
+        self._draw_centered_text(painter, header_text, self._export_font(int(32 * scale_factor / 3.0)), width, 0)
+        # Skip the settings line entirely when there is nothing to show
+        if settings_text:
+            self._draw_centered_text(painter, settings_text, self._export_font(int(28 * scale_factor / 3.0)), width, int(header_height/2))
+
+    def _render_legend(self, painter, legend_layout, y, scale_factor):
+        """Draw the feature legend (color dots and labels) in a single row at y."""
+        if legend_layout is None or legend_layout.count() == 0:
+            return
+        painter.setFont(self._export_font(int(28 * scale_factor / 3.0), bold=False))
+        metrics = painter.fontMetrics()
+        x = 40
+        dot_radius = int(18 * scale_factor / 3.0)
+        spacing = int(60 * scale_factor / 3.0)
+        for i in range(legend_layout.count()):
+            item = legend_layout.itemAt(i)
+            widget = item.widget()
+            if not widget or widget.isHidden():
+                continue
+            if isinstance(widget, QLabel):
+                html = widget.text()
+                # A label may hold several <br>-separated entries
+                entries = [(match.group(1), match.group(3)) for match in _LEGEND_RE.finditer(html)]
+                if not entries:
+                    entries = [("#000000", html)]
+                for color, label in entries:
+                    if label.strip() == "Motors:":
+                        # Just draw the label, no dot
+                        painter.setPen(QColor(0, 0, 0))
+                        painter.drawText(x, y + dot_radius, label)
+                        x += metrics.horizontalAdvance(label) + spacing // 2
+                    else:
+                        painter.setPen(QColor(color))
+                        painter.setBrush(QColor(color))
+                        painter.drawEllipse(x, y, dot_radius, dot_radius)
+                        painter.setPen(QColor(0, 0, 0))
+                        painter.drawText(x + dot_radius + 12, y + dot_radius, label)
+                        x += spacing + metrics.horizontalAdvance(label)
+            else:
+                # Handle motor widget
+                # Find all visible QLabel children (title, dots and numbers)
+                cx = x
+                for child in widget.findChildren(QLabel):
+                    if child.isHidden():
+                        continue
+                    text = child.text()
+                    style = child.styleSheet()
+                    if "color:" in style:
+                        # This is a dot
+                        color = style.split("color:")[1].split(";")[0].strip()
+                        painter.setPen(QColor(color))
+                        painter.setBrush(QColor(color))
+                        painter.drawEllipse(cx, y, dot_radius, dot_radius)
+                        cx += dot_radius + 4
+                    else:
+                        # This is a number
+                        painter.setPen(QColor(0, 0, 0))
+                        painter.drawText(cx, y + dot_radius, text)
+                        cx += metrics.horizontalAdvance(text) + spacing // 2
+                x = cx + spacing // 2
+
+    def _render_chart(self, painter, chart_view, size, x, y, scale_factor):
+        """Render chart_view (measured as size = (w, h)) scaled straight into the export painter at (x, y); returns the rendered height."""
+        view_width, view_height = size
+        width = int(view_width * scale_factor)
+        height = int(view_height * scale_factor)
+        # PSD series are M4-reduced for the on-screen width; re-reduce them for the export width
+        reduced = [(series, series._m4_buckets) for series in chart_view.chart().series()
+                   if getattr(series, '_freqs', None) is not None]
+        for series, _ in reduced:
+            _m4_fill(series, width)
+        # No intermediate pixmap: the canvas is already white, so the chart paints directly onto it
+        chart_view.render(painter, target=QRectF(x, y, width, height), source=QRect(0, 0, view_width, view_height))
+        for series, n_buckets in reduced:
+            _m4_fill(series, n_buckets)
+        return height
+
     def _export_time_domain_plots(self, parent):
         try:
             chart_views = parent.chart_manager.chart_views
             if not chart_views:
                 self.status_label.setText("No plots to export")
                 return
-            export_dir = self._get_export_dir(parent)
-            import os
-            os.makedirs(export_dir, exist_ok=True)
-            import datetime
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2297,114 +2763,33 @@ class PlotExportWidget(QWidget):
             drone_name_filename = drone_name.replace(' ', '_') if drone_name else ''
             use_drone = self._use_drone_in_filename(parent)
             author_name = self._get_author_name(parent)
-            from PySide6.QtGui import QImage, QPainter, QPixmap, QFont, QColor
-            from PySide6.QtCore import QSize, Qt, QRect
             scale_factor = 3.5
             header_height = int(100 * scale_factor)
             legend_height = int(60 * scale_factor)
-            width = int(chart_views[0].width() * scale_factor)
-            chart_height = int(sum(view.height() for view in chart_views) * scale_factor)
+            # Measure every view once
+            dims = [(view.width(), view.height()) for view in chart_views]
+            width = int(dims[0][0] * scale_factor)
+            chart_height = int(sum(h for _, h in dims) * scale_factor)
             total_height = chart_height + header_height + legend_height
-            combined_image = QImage(width, total_height, QImage.Format_ARGB32)
-            combined_image.fill(Qt.white)
+            combined_image = self._export_canvas(width, total_height)
             painter = QPainter(combined_image)
             try:
                 painter.setRenderHint(QPainter.Antialiasing, True)
                 painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                header_font = QFont("fccTYPO", int(32 * scale_factor / 3.0))
-                header_font.setBold(True)
-                painter.setFont(header_font)
-                painter.setPen(QColor(0, 0, 0))
-                header_text = f"Log: {log_name} | Time Domain | Date: {current_date}"
-                if author_name:
-                    header_text += f" | Author: {author_name}"
-                if drone_name:
-                    header_text += f" | Drone: {drone_name}"
-                header_rect = QRect(0, 0, width, header_height)
-                painter.fillRect(header_rect, QColor(230, 230, 240))
-                painter.drawText(header_rect, Qt.AlignCenter | Qt.AlignTop, header_text)
-                settings_font = QFont("fccTYPO", int(28 * scale_factor / 3.0))
-                settings_font.setBold(True)
-                painter.setFont(settings_font)
+                header_text = self._export_header_text(log_name, "Time Domain", current_date, author_name, drone_name)
                 # Get zoom and line width info
-                zoom_info = ""
-                if hasattr(parent, 'control_widget') and hasattr(parent.control_widget, 'zoom_ratio_label'):
-                    zoom_info = f"Zoom: {parent.control_widget.zoom_ratio_label.text()}"
                 line_width = getattr(parent.feature_widget, 'current_line_width', 1.0)
-                settings_text = f"Line Width: {line_width} | {zoom_info}"
-                settings_rect = QRect(0, int(header_height/2), width, int(header_height/2))
-                painter.drawText(settings_rect, Qt.AlignCenter | Qt.AlignTop, settings_text)
+                settings_parts = [f"Line Width: {line_width}"]
+                if hasattr(parent, 'control_widget') and hasattr(parent.control_widget, 'zoom_ratio_label'):
+                    settings_parts.append(f"Zoom: {parent.control_widget.zoom_ratio_label.text()}")
+                settings_text = " | ".join(settings_parts)
+                self._render_export_header(painter, width, header_height, scale_factor, header_text, settings_text)
                 # Draw legend preview
                 legend_layout = getattr(parent.feature_widget, 'legend_layout', None)
-                if legend_layout is not None and legend_layout.count() > 0:
-                    legend_font = QFont("fccTYPO", int(28 * scale_factor / 3.0))
-                    legend_font.setBold(False)
-                    painter.setFont(legend_font)
-                    y = header_height + int(legend_height * 0.3)
-                    x = 40
-                    dot_radius = int(18 * scale_factor / 3.0)
-                    spacing = int(60 * scale_factor / 3.0)
-                    for i in range(legend_layout.count()):
-                        item = legend_layout.itemAt(i)
-                        widget = item.widget()
-                        if widget:
-                            from PySide6.QtWidgets import QLabel
-                            if isinstance(widget, QLabel):
-                                import re
-                                html = widget.text()
-                                match = re.search(r"color: ([^']+).*?>(.*?)<.*?>(.*)", html)
-                                if match:
-                                    color = match.group(1)
-                                    label = match.group(3)
-                                else:
-                                    color = "#000000"
-                                    label = widget.text()
-                                if label.strip() == "Motors:":
-                                    # Just draw the label, no dot
-                                    painter.setPen(QColor(0, 0, 0))
-                                    painter.drawText(x, y + dot_radius, label)
-                                    x += painter.fontMetrics().horizontalAdvance(label) + spacing // 2
-                                else:
-                                    painter.setPen(QColor(color))
-                                    painter.setBrush(QColor(color))
-                                    painter.drawEllipse(x, y, dot_radius, dot_radius)
-                                    painter.setPen(QColor(0, 0, 0))
-                                    painter.drawText(x + dot_radius + 12, y + dot_radius, label)
-                                    x += spacing + painter.fontMetrics().horizontalAdvance(label)
-                            else:
-                                # Handle motor row widget
-                                # Find all QLabel children (dots and numbers)
-                                child_labels = widget.findChildren(QLabel)
-                                cx = x
-                                for child in child_labels:
-                                    text = child.text()
-                                    style = child.styleSheet()
-                                    if "color:" in style:
-                                        # This is a dot
-                                        color = style.split("color:")[1].split(";")[0].strip()
-                                        painter.setPen(QColor(color))
-                                        painter.setBrush(QColor(color))
-                                        painter.drawEllipse(cx, y, dot_radius, dot_radius)
-                                        cx += dot_radius + 4
-                                    else:
-                                        # This is a number
-                                        painter.setPen(QColor(0, 0, 0))
-                                        painter.drawText(cx, y + dot_radius, text)
-                                        cx += painter.fontMetrics().horizontalAdvance(text) + spacing // 2
-                                x = cx + spacing // 2
-                painter.setPen(QColor(180, 180, 180))
+                self._render_legend(painter, legend_layout, header_height + int(legend_height * 0.3), scale_factor)
                 current_y = header_height + legend_height
-                for chart_view in chart_views:
-                    original_size = chart_view.size()
-                    scaled_size = QSize(int(original_size.width() * scale_factor), int(original_size.height() * scale_factor))
-                    pixmap = QPixmap(scaled_size)
-                    pixmap.fill(Qt.white)
-                    temp_painter = QPainter(pixmap)
-                    temp_painter.setRenderHint(QPainter.Antialiasing, True)
-                    chart_view.render(temp_painter, target=pixmap.rect(), source=chart_view.rect())
-                    temp_painter.end()
-                    painter.drawPixmap(0, current_y, pixmap)
-                    current_y += pixmap.height()
+                for chart_view, size in zip(chart_views, dims):
+                    current_y += self._render_chart(painter, chart_view, size, 0, current_y, scale_factor)
             finally:
                 painter.end()
             if use_drone and drone_name:
@@ -2412,8 +2797,7 @@ class PlotExportWidget(QWidget):
             else:
                 filename = f"{log_name}-TimeDomain-{timestamp}.jpg"
             filepath = os.path.join(export_dir, filename)
-            combined_image.save(filepath, "JPG", quality=100)
-            self.status_label.setText(f"Exported stacked Time Domain plots to {export_dir} as {filename}")
+            self._save_image_async(combined_image, filepath, f"Exported stacked Time Domain plots to {export_dir} as {filename}")
         except Exception as e:
             self.status_label.setText(f"Error exporting time domain plots: {str(e)}")
 
@@ -2425,10 +2809,7 @@ class PlotExportWidget(QWidget):
             if not chart_views:
                 self.status_label.setText("No spectral plots to export")
                 return
-            export_dir = self._get_export_dir(parent)
-            import os
-            os.makedirs(export_dir, exist_ok=True)
-            import datetime
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2437,122 +2818,37 @@ class PlotExportWidget(QWidget):
             drone_name_filename = drone_name.replace(' ', '_') if drone_name else ''
             use_drone = self._use_drone_in_filename(parent)
             author_name = self._get_author_name(parent)
-            from PySide6.QtGui import QImage, QPainter, QPixmap, QFont, QColor
-            from PySide6.QtCore import QSize, Qt, QRect
             scale_factor = 3.5
             header_height = int(100 * scale_factor)
             legend_height = int(60 * scale_factor)
             nrows = 3
             # Calculate left and right column widths separately
-            left_col_width = int(max(full.width() for full, _ in chart_views) * scale_factor)
-            right_col_width = int(max(zoom.width() for _, zoom in chart_views) * scale_factor)
-            cell_height = int(max(max(full.height(), zoom.height()) for full, zoom in chart_views) * scale_factor)
+            # Measure every view once
+            dims = [((full.width(), full.height()), (zoom.width(), zoom.height())) for full, zoom in chart_views]
+            left_col_width = int(max(full[0] for full, _ in dims) * scale_factor)
+            right_col_width = int(max(zoom[0] for _, zoom in dims) * scale_factor)
+            cell_height = int(max(max(full[1], zoom[1]) for full, zoom in dims) * scale_factor)
             width = left_col_width + right_col_width
             chart_height = cell_height * nrows
             total_height = header_height + legend_height + chart_height
-            combined_image = QImage(width, total_height, QImage.Format_ARGB32)
-            combined_image.fill(Qt.white)
+            combined_image = self._export_canvas(width, total_height)
             painter = QPainter(combined_image)
             try:
                 painter.setRenderHint(QPainter.Antialiasing, True)
                 painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                header_font = QFont("fccTYPO", int(32 * scale_factor / 3.0))
-                header_font.setBold(True)
-                painter.setFont(header_font)
-                painter.setPen(QColor(0, 0, 0))
-                header_text = f"Log: {log_name} | Frequency Domain | Date: {current_date}"
-                if author_name:
-                    header_text += f" | Author: {author_name}"
-                if drone_name:
-                    header_text += f" | Drone: {drone_name}"
-                header_rect = QRect(0, 0, width, header_height)
-                painter.fillRect(header_rect, QColor(230, 230, 240))
-                painter.drawText(header_rect, Qt.AlignCenter | Qt.AlignTop, header_text)
-                settings_font = QFont("fccTYPO", int(28 * scale_factor / 3.0))
-                settings_font.setBold(True)
-                painter.setFont(settings_font)
+                header_text = self._export_header_text(log_name, "Frequency Domain", current_date, author_name, drone_name)
                 settings_text = f"Smoothing: {parent.spectral_widget.window_sizes[parent.spectral_widget.window_size_slider.value()]}"
-                settings_rect = QRect(0, int(header_height/2), width, int(header_height/2))
-                painter.drawText(settings_rect, Qt.AlignCenter | Qt.AlignTop, settings_text)
-                # Draw legend preview (reuse logic from time domain if desired)
+                self._render_export_header(painter, width, header_height, scale_factor, header_text, settings_text)
+                # Draw legend preview
                 legend_layout = getattr(parent.feature_widget, 'legend_layout', None)
-                if legend_layout is not None and legend_layout.count() > 0:
-                    legend_font = QFont("fccTYPO", int(28 * scale_factor / 3.0))
-                    legend_font.setBold(False)
-                    painter.setFont(legend_font)
-                    y = header_height + int(legend_height * 0.3)
-                    x = 40
-                    dot_radius = int(18 * scale_factor / 3.0)
-                    spacing = int(60 * scale_factor / 3.0)
-                    for i in range(legend_layout.count()):
-                        item = legend_layout.itemAt(i)
-                        widget = item.widget()
-                        if widget:
-                            from PySide6.QtWidgets import QLabel
-                            if isinstance(widget, QLabel):
-                                import re
-                                html = widget.text()
-                                match = re.search(r"color: ([^']+).*?>(.*?)<.*?>(.*)", html)
-                                if match:
-                                    color = match.group(1)
-                                    label = match.group(3)
-                                else:
-                                    color = "#000000"
-                                    label = widget.text()
-                                if label.strip() == "Motors:":
-                                    painter.setPen(QColor(0, 0, 0))
-                                    painter.drawText(x, y + dot_radius, label)
-                                    x += painter.fontMetrics().horizontalAdvance(label) + spacing // 2
-                                else:
-                                    painter.setPen(QColor(color))
-                                    painter.setBrush(QColor(color))
-                                    painter.drawEllipse(x, y, dot_radius, dot_radius)
-                                    painter.setPen(QColor(0, 0, 0))
-                                    painter.drawText(x + dot_radius + 12, y + dot_radius, label)
-                                    x += spacing + painter.fontMetrics().horizontalAdvance(label)
-                            else:
-                                child_labels = widget.findChildren(QLabel)
-                                cx = x
-                                for child in child_labels:
-                                    text = child.text()
-                                    style = child.styleSheet()
-                                    if "color:" in style:
-                                        color = style.split("color:")[1].split(";")[0].strip()
-                                        painter.setPen(QColor(color))
-                                        painter.setBrush(QColor(color))
-                                        painter.drawEllipse(cx, y, dot_radius, dot_radius)
-                                        cx += dot_radius + 4
-                                    else:
-                                        painter.setPen(QColor(0, 0, 0))
-                                        painter.drawText(cx, y + dot_radius, text)
-                                        cx += painter.fontMetrics().horizontalAdvance(text) + spacing // 2
-                                x = cx + spacing // 2
-                painter.setPen(QColor(180, 180, 180))
+                self._render_legend(painter, legend_layout, header_height + int(legend_height * 0.3), scale_factor)
                 # Draw charts in 3x2 grid with correct column widths
-                for row, (chart_view_full, chart_view_zoom) in enumerate(chart_views):
-                    # Left column (full)
-                    original_size_full = chart_view_full.size()
-                    scaled_size_full = QSize(int(original_size_full.width() * scale_factor), int(original_size_full.height() * scale_factor))
-                    pixmap_full = QPixmap(scaled_size_full)
-                    pixmap_full.fill(Qt.white)
-                    temp_painter = QPainter(pixmap_full)
-                    temp_painter.setRenderHint(QPainter.Antialiasing, True)
-                    chart_view_full.render(temp_painter, target=pixmap_full.rect(), source=chart_view_full.rect())
-                    temp_painter.end()
-                    x_offset_full = 0
+                for row, ((chart_view_full, chart_view_zoom), (size_full, size_zoom)) in enumerate(zip(chart_views, dims)):
                     y_offset = header_height + legend_height + row * cell_height
-                    painter.drawPixmap(x_offset_full, y_offset, pixmap_full)
+                    # Left column (full)
+                    self._render_chart(painter, chart_view_full, size_full, 0, y_offset, scale_factor)
                     # Right column (zoomed)
-                    original_size_zoom = chart_view_zoom.size()
-                    scaled_size_zoom = QSize(int(original_size_zoom.width() * scale_factor), int(original_size_zoom.height() * scale_factor))
-                    pixmap_zoom = QPixmap(scaled_size_zoom)
-                    pixmap_zoom.fill(Qt.white)
-                    temp_painter = QPainter(pixmap_zoom)
-                    temp_painter.setRenderHint(QPainter.Antialiasing, True)
-                    chart_view_zoom.render(temp_painter, target=pixmap_zoom.rect(), source=chart_view_zoom.rect())
-                    temp_painter.end()
-                    x_offset_zoom = left_col_width
-                    painter.drawPixmap(x_offset_zoom, y_offset, pixmap_zoom)
+                    self._render_chart(painter, chart_view_zoom, size_zoom, left_col_width, y_offset, scale_factor)
             finally:
                 painter.end()
             if use_drone and drone_name:
@@ -2560,8 +2856,7 @@ class PlotExportWidget(QWidget):
             else:
                 filename = f"{log_name}-FrequencyDomain-{timestamp}.jpg"
             filepath = os.path.join(export_dir, filename)
-            combined_image.save(filepath, "JPG", quality=100)
-            self.status_label.setText(f"Exported stacked Spectral plots to {export_dir} as {filename}")
+            self._save_image_async(combined_image, filepath, f"Exported stacked Spectral plots to {export_dir} as {filename}")
         except Exception as e:
             self.status_label.setText(f"Error exporting spectral plots: {str(e)}")
     
@@ -2571,10 +2866,7 @@ class PlotExportWidget(QWidget):
             if not chart_views:
                 self.status_label.setText("No step response plots to export")
                 return
-            export_dir = self._get_export_dir(parent)
-            import os
-            os.makedirs(export_dir, exist_ok=True)
-            import datetime
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2583,44 +2875,23 @@ class PlotExportWidget(QWidget):
             drone_name_filename = drone_name.replace(' ', '_') if drone_name else ''
             use_drone = self._use_drone_in_filename(parent)
             author_name = self._get_author_name(parent)
-            from PySide6.QtGui import QImage, QPainter, QPixmap, QFont, QColor
-            from PySide6.QtCore import QSize, Qt, QRect
             scale_factor = 3.5
             header_height = int(100 * scale_factor)
-            width = int(chart_views[0].width() * scale_factor)
-            chart_height = int(sum(view.height() for view in chart_views) * scale_factor)
+            # Measure every view once
+            dims = [(view.width(), view.height()) for view in chart_views]
+            width = int(dims[0][0] * scale_factor)
+            chart_height = int(sum(h for _, h in dims) * scale_factor)
             total_height = chart_height + header_height
-            combined_image = QImage(width, total_height, QImage.Format_ARGB32)
-            combined_image.fill(Qt.white)
+            combined_image = self._export_canvas(width, total_height)
             painter = QPainter(combined_image)
             try:
                 painter.setRenderHint(QPainter.Antialiasing, True)
                 painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                header_font = QFont("fccTYPO", int(32 * scale_factor / 3.0))
-                header_font.setBold(True)
-                painter.setFont(header_font)
-                painter.setPen(QColor(0, 0, 0))
-                header_text = f"Log: {log_name} | Step Response | Date: {current_date}"
-                if author_name:
-                    header_text += f" | Author: {author_name}"
-                if drone_name:
-                    header_text += f" | Drone: {drone_name}"
-                header_rect = QRect(0, 0, width, header_height)
-                painter.fillRect(header_rect, QColor(230, 230, 240))
-                painter.drawText(header_rect, Qt.AlignCenter | Qt.AlignTop, header_text)
-                painter.setPen(QColor(180, 180, 180))
+                header_text = self._export_header_text(log_name, "Step Response", current_date, author_name, drone_name)
+                self._render_export_header(painter, width, header_height, scale_factor, header_text)
                 current_y = header_height
-                for chart_view in chart_views:
-                    original_size = chart_view.size()
-                    scaled_size = QSize(int(original_size.width() * scale_factor), int(original_size.height() * scale_factor))
-                    pixmap = QPixmap(scaled_size)
-                    pixmap.fill(Qt.white)
-                    temp_painter = QPainter(pixmap)
-                    temp_painter.setRenderHint(QPainter.Antialiasing, True)
-                    chart_view.render(temp_painter, target=pixmap.rect(), source=chart_view.rect())
-                    temp_painter.end()
-                    painter.drawPixmap(0, current_y, pixmap)
-                    current_y += pixmap.height()
+                for chart_view, size in zip(chart_views, dims):
+                    current_y += self._render_chart(painter, chart_view, size, 0, current_y, scale_factor)
             finally:
                 painter.end()
             if use_drone and drone_name:
@@ -2628,24 +2899,49 @@ class PlotExportWidget(QWidget):
             else:
                 filename = f"{log_name}-StepResponse-{timestamp}.jpg"
             filepath = os.path.join(export_dir, filename)
-            combined_image.save(filepath, "JPG", quality=100)
-            self.status_label.setText(f"Exported stacked Step Response plots to {export_dir} as {filename}")
+            self._save_image_async(combined_image, filepath, f"Exported stacked Step Response plots to {export_dir} as {filename}")
         except Exception as e:
             self.status_label.setText(f"Error exporting step response plots: {str(e)}")
     
+    def _rasterize_figure(self, fig, dpi):
+        """Rasterize a matplotlib figure to a QImage via its raw RGBA buffer (no PNG encode/decode or temp file)."""
+        buf = io.BytesIO()
+        fig.savefig(buf, format='rgba', dpi=dpi, facecolor=fig.get_facecolor())
+        data = buf.getvalue()
+        # Agg sizes the raster as the truncated figure size in pixels
+        width = int(fig.get_figwidth() * dpi)
+        height = int(fig.get_figheight() * dpi)
+        if len(data) != width * height * 4:
+            # Unexpected raster size, fall back to a PNG round trip
+            buf = io.BytesIO()
+            fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+            return QImage.fromData(buf.getvalue(), "PNG")
+        # Crop the uniform background border like bbox_inches='tight' (default 0.1in pad):
+        # savefig's tight mode would re-layout the figure and make the raster size unknowable
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+        # Compare whole RGBA pixels as one 32-bit word each: a single HxW temporary
+        words = pixels.view(np.uint32)[..., 0]
+        content = words != words[0, 0]
+        rows = np.flatnonzero(content.any(axis=1))
+        cols = np.flatnonzero(content.any(axis=0))
+        if rows.size and cols.size:
+            pad = int(round(0.1 * dpi))
+            pixels = pixels[max(rows[0] - pad, 0):rows[-1] + 1 + pad,
+                            max(cols[0] - pad, 0):cols[-1] + 1 + pad]
+            data = np.ascontiguousarray(pixels).tobytes()
+            height, width = pixels.shape[:2]
+        # Export figures are opaque, so tag the buffer RGBX: the blit onto the RGB32 canvas
+        # is then a plain channel copy instead of a per-pixel alpha blend.
+        # Copy so the image owns its pixels once the bytes object goes away
+        return QImage(data, width, height, width * 4, QImage.Format_RGBX8888).copy()
+
     def _export_frequency_analyzer_plots(self, parent):
         try:
             freq_widget = parent.frequency_analyzer_widget
             if not hasattr(freq_widget, 'canvas_list') or not freq_widget.canvas_list:
                 self.status_label.setText("No Noise Analysis plots to export.")
                 return
-            export_dir = self._get_export_dir(parent)
-            import os
-            os.makedirs(export_dir, exist_ok=True)
-            import datetime
-            import tempfile
-            from PySide6.QtGui import QImage, QPainter, QFont, QColor, QPixmap
-            from PySide6.QtCore import Qt, QRect
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2660,39 +2956,30 @@ class PlotExportWidget(QWidget):
                 self.status_label.setText("No valid Noise Analysis plots to export.")
                 return
             for i, fig in enumerate(figures):
-                # Save the matplotlib figure to a temporary PNG file at high DPI
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmpfile:
-                    fig.savefig(tmpfile.name, dpi=350, bbox_inches='tight')
-                    tmpfile.flush()
-                    # Load the plot image
-                    plot_img = QImage(tmpfile.name)
+                # Rasterize the figure once, straight into memory
+                plot_img = self._rasterize_figure(fig, EXPORT_CONFIG['dpi'])
                 # Calculate header height
                 scale_factor = plot_img.devicePixelRatioF() if hasattr(plot_img, 'devicePixelRatioF') else 1.0
                 header_height = int(100 * scale_factor)
                 width = plot_img.width()
                 total_height = header_height + plot_img.height()
                 # Create the final image
-                final_img = QImage(width, total_height, QImage.Format_ARGB32)
-                final_img.fill(Qt.white)
+                final_img = self._export_canvas(width, total_height)
                 painter = QPainter(final_img)
                 try:
-                    painter.setRenderHint(QPainter.Antialiasing, True)
-                    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+                    # Only text and 1:1 image blits here, so no antialiasing or smooth scaling is needed
                     # Draw header
-                    header_font = QFont("fccTYPO", int(94 * scale_factor / 3.0))
-                    header_font.setBold(True)
-                    painter.setFont(header_font)
+                    painter.setFont(self._export_font(int(94 * scale_factor / 3.0)))
                     painter.setPen(QColor(0, 0, 0))
-                    header_text = f"Log: {log_name} - Noise Analysis - {timestamp}"
+                    parts = [f"Log: {log_name}", "Noise Analysis", timestamp]
                     if author_name:
-                        header_text += f" - {author_name}"
+                        parts.append(author_name)
                     if use_drone and drone_name:
-                        header_text += f" - {drone_name}"
+                        parts.append(drone_name)
+                    header_text = " - ".join(parts)
                     painter.drawText(QRect(0, 0, width, header_height), Qt.AlignCenter | Qt.AlignTop, header_text)
                     # Draw gain info with more space below header
-                    gain_font = QFont("fccTYPO", int(82 * scale_factor / 3.0))
-                    gain_font.setBold(True)
-                    painter.setFont(gain_font)
+                    painter.setFont(self._export_font(int(82 * scale_factor / 3.0)))
                     gain_text = f"Gain: {gain}x"
                     gain_rect = QRect(0, int(header_height * 0.75), width, int(header_height * 0.25))
                     painter.drawText(gain_rect, Qt.AlignCenter | Qt.AlignTop, gain_text)
@@ -2704,23 +2991,19 @@ class PlotExportWidget(QWidget):
                     filename = f"{log_name}_{drone_name_filename}_NoiseAnalysis_{i+1}_{timestamp}.jpg"
                 else:
                     filename = f"{log_name}_NoiseAnalysis_{i+1}_{timestamp}.jpg"
-                final_img.save(os.path.join(export_dir, filename), "JPG", quality=100)
-            self.status_label.setText(f"Exported stacked Noise Analysis plots to {export_dir} as {filename}")
+                self._save_image_async(final_img, os.path.join(export_dir, filename),
+                                       f"Exported stacked Noise Analysis plots to {export_dir} as {filename}")
         except Exception as e:
+            logger.exception("Noise Analysis export failed")
             self.status_label.setText(f"Error exporting frequency plots: {str(e)}")
 
     def _export_spectrogram_plots(self, parent):
         try:
-            import datetime
-            import os
             spectrogram_widget = parent.spectrogram_widget
             if not hasattr(spectrogram_widget, 'canvas_list') or not spectrogram_widget.canvas_list:
                 self.status_label.setText("No Frequency Evolution plots to export.")
                 return
 
-            import io
-            from PySide6.QtGui import QImage, QPainter, QPixmap, QFont, QColor
-            from PySide6.QtCore import QSize, Qt, QRect, QPoint
 
             # 1. Render all canvases to in-memory pixmaps to correctly calculate dimensions
             pixmaps = []
@@ -2728,7 +3011,7 @@ class PlotExportWidget(QWidget):
                 try:
                     buf = io.BytesIO()
                     # Use savefig with bbox_inches='tight' to remove whitespace around the figure
-                    canvas.figure.savefig(buf, format='png', dpi=300, bbox_inches='tight', pad_inches=0.1)
+                    canvas.figure.savefig(buf, format='png', dpi=EXPORT_CONFIG['dpi'], bbox_inches='tight', pad_inches=0.1)
                     buf.seek(0)
                     pixmap = QPixmap()
                     pixmap.loadFromData(buf.read())
@@ -2752,8 +3035,7 @@ class PlotExportWidget(QWidget):
                 scaled_pixmaps.append(scaled_p)
                 total_chart_height += scaled_p.height()
 
-            export_dir = self._get_export_dir(parent)
-            os.makedirs(export_dir, exist_ok=True)
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2771,42 +3053,27 @@ class PlotExportWidget(QWidget):
             total_height = header_height + total_chart_height
 
             # 3. Create the combined image
-            combined_image = QImage(width, total_height, QImage.Format_ARGB32)
-            combined_image.fill(Qt.white)
+            combined_image = self._export_canvas(width, total_height)
             painter = QPainter(combined_image)
 
             try:
-                painter.setRenderHint(QPainter.Antialiasing, True)
-                painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+                # Only text and 1:1 image blits here, so no antialiasing or smooth scaling is needed
 
                 # Draw header
-                header_font = QFont("fccTYPO", int(32 * header_font_scale / 3.0))
-                header_font.setBold(True)
-                painter.setFont(header_font)
-                painter.setPen(QColor(0, 0, 0))
-                header_text = f"Log: {log_name} | Frequency Evolution | Date: {current_date}"
-                if author_name:
-                    header_text += f" | Author: {author_name}"
-                if drone_name:
-                    header_text += f" | Drone: {drone_name}"
-                header_rect = QRect(0, 0, width, header_height)
-                painter.fillRect(header_rect, QColor(230, 230, 240))
-                painter.drawText(header_rect, Qt.AlignCenter | Qt.AlignTop, header_text)
-                
-                settings_font = QFont("fccTYPO", int(28 * header_font_scale / 3.0))
-                settings_font.setBold(True)
-                painter.setFont(settings_font)
+                header_text = self._export_header_text(log_name, "Frequency Evolution", current_date, author_name, drone_name)
                 window_size = 2 ** spectrogram_widget.window_slider.value()
                 gain_value = spectrogram_widget.gain
                 settings_text = f"Window Size: {window_size} | Gain: {gain_value}x"
-                settings_rect = QRect(0, int(header_height/2), width, int(header_height/2))
-                painter.drawText(settings_rect, Qt.AlignCenter | Qt.AlignTop, settings_text)
+                self._render_export_header(painter, width, header_height, header_font_scale, header_text, settings_text)
 
                 # 4. Draw the tightly cropped pixmaps onto the combined image
                 current_y = header_height
+                # The rendered figures are opaque, so copy them straight in instead of alpha blending
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
                 for pixmap in scaled_pixmaps:
                     painter.drawPixmap(0, current_y, pixmap)
                     current_y += pixmap.height()
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
             finally:
                 painter.end()
 
@@ -2816,11 +3083,9 @@ class PlotExportWidget(QWidget):
             else:
                 filename = f"{log_name}-FrequencyEvolution-{timestamp}.jpg"
             filepath = os.path.join(export_dir, filename)
-            combined_image.save(filepath, "JPG", quality=100)
-            self.status_label.setText(f"Exported stacked Frequency Evolution plots to {export_dir} as {filename}")
+            self._save_image_async(combined_image, filepath, f"Exported stacked Frequency Evolution plots to {export_dir} as {filename}")
         except Exception as e:
-            import traceback
-            print(f"Error exporting frequency evolution plots: {e}\n{traceback.format_exc()}")
+            logger.exception("Frequency Evolution export failed")
             self.status_label.setText(f"Error exporting frequency evolution plots: {str(e)}")
 
     def _export_error_performance_plots(self, parent):
@@ -2833,10 +3098,7 @@ class PlotExportWidget(QWidget):
                 self.status_label.setText("No Error & Performance plots to export")
                 return
             chart_views = error_widget.chart_views
-            export_dir = self._get_export_dir(parent)
-            import os
-            os.makedirs(export_dir, exist_ok=True)
-            import datetime
+            export_dir = self._get_export_dir(parent)  # Already created by _get_export_dir
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_name = parent.feature_widget.selected_logs[0] if hasattr(parent.feature_widget, 'selected_logs') and parent.feature_widget.selected_logs else "LogFile"
@@ -2845,35 +3107,19 @@ class PlotExportWidget(QWidget):
             drone_name_filename = drone_name.replace(' ', '_') if drone_name else ''
             use_drone = self._use_drone_in_filename(parent)
             author_name = self._get_author_name(parent)
-            from PySide6.QtGui import QImage, QPainter, QPixmap, QFont, QColor
-            from PySide6.QtCore import QSize, Qt, QRect
             scale_factor = 3.5
             header_height = int(100 * scale_factor)
-            width = int(chart_views[0].width() * scale_factor)
-            chart_height = int(sum(view.height() for view in chart_views) * scale_factor)
+            # Measure every view once
+            dims = [(view.width(), view.height()) for view in chart_views]
+            width = int(dims[0][0] * scale_factor)
+            chart_height = int(sum(h for _, h in dims) * scale_factor)
             total_height = chart_height + header_height
-            combined_image = QImage(width, total_height, QImage.Format_ARGB32)
-            combined_image.fill(Qt.white)
+            combined_image = self._export_canvas(width, total_height)
             painter = QPainter(combined_image)
             try:
                 painter.setRenderHint(QPainter.Antialiasing, True)
                 painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-                header_font = QFont("fccTYPO", int(32 * scale_factor / 3.0))
-                header_font.setBold(True)
-                painter.setFont(header_font)
-                painter.setPen(QColor(0, 0, 0))
-                header_text = f"Log: {log_name} | Error & Performance | Date: {current_date}"
-                if author_name:
-                    header_text += f" | Author: {author_name}"
-                if drone_name:
-                    header_text += f" | Drone: {drone_name}"
-                header_rect = QRect(0, 0, width, header_height)
-                painter.fillRect(header_rect, QColor(230, 230, 240))
-                painter.drawText(header_rect, Qt.AlignCenter | Qt.AlignTop, header_text)
-                settings_font = QFont("fccTYPO", int(28 * scale_factor / 3.0))
-                settings_font.setBold(True)
-                painter.setFont(settings_font)
-                # Get line width info
+                header_text = self._export_header_text(log_name, "Error & Performance", current_date, author_name, drone_name)
                 # Show which radio button (plot option) was selected
                 selected_option = None
                 if hasattr(error_widget, 'plot_checkboxes'):
@@ -2884,22 +3130,11 @@ class PlotExportWidget(QWidget):
                 if selected_option is None:
                     selected_option = "(No plot option selected)"
                 settings_text = f"Selected Plot: {selected_option}"
-                settings_rect = QRect(0, int(header_height/2), width, int(header_height/2))
-                painter.drawText(settings_rect, Qt.AlignCenter | Qt.AlignTop, settings_text)
+                self._render_export_header(painter, width, header_height, scale_factor, header_text, settings_text)
                 # No legend for error/performance tab
-                painter.setPen(QColor(180, 180, 180))
                 current_y = header_height
-                for chart_view in chart_views:
-                    original_size = chart_view.size()
-                    scaled_size = QSize(int(original_size.width() * scale_factor), int(original_size.height() * scale_factor))
-                    pixmap = QPixmap(scaled_size)
-                    pixmap.fill(Qt.white)
-                    temp_painter = QPainter(pixmap)
-                    temp_painter.setRenderHint(QPainter.Antialiasing, True)
-                    chart_view.render(temp_painter, target=pixmap.rect(), source=chart_view.rect())
-                    temp_painter.end()
-                    painter.drawPixmap(0, current_y, pixmap)
-                    current_y += pixmap.height()
+                for chart_view, size in zip(chart_views, dims):
+                    current_y += self._render_chart(painter, chart_view, size, 0, current_y, scale_factor)
             finally:
                 painter.end()
             if use_drone and drone_name:
@@ -2907,8 +3142,7 @@ class PlotExportWidget(QWidget):
             else:
                 filename = f"{log_name}-ErrorPerformance-{timestamp}.jpg"
             filepath = os.path.join(export_dir, filename)
-            combined_image.save(filepath, "JPG", quality=100)
-            self.status_label.setText(f"Exported Error & Performance plots to {export_dir} as {filename}")
+            self._save_image_async(combined_image, filepath, f"Exported Error & Performance plots to {export_dir} as {filename}")
         except Exception as e:
             self.status_label.setText(f"Error exporting Error & Performance plots: {str(e)}")
 
@@ -3154,41 +3388,17 @@ class ParametersWidget(QWidget):
         """Parse the header of a .bbl file and return a dict of sections to key-value pairs."""
         if not bbl_path or not os.path.exists(bbl_path):
             return {}
-        sections = {}
-        seen_params = set()  # Keep track of parameters we've already seen
         try:
-            with open(bbl_path, 'r', encoding='latin-1', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line.startswith('H '):
-                        continue
-                    # Remove the leading 'H '
-                    line = line[2:]
-                    # Only process lines with a colon
-                    if ':' not in line:
-                        continue
-                    # Try to split into section and value
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Skip if we've already seen this parameter
-                    if key in seen_params:
-                        continue
-                    seen_params.add(key)
-                    # Group by the part before the first space (e.g., 'Field I', 'Firmware', etc.)
-                    section = key.split(' ')[0] if ' ' in key else key
-                    if section not in sections:
-                        sections[section] = []
-                    sections[section].append((key, value))
-            return sections
-        except Exception as e:
+            st = os.stat(bbl_path)
+        except OSError as e:
             print(f"[ParametersWidget] Failed to parse .bbl header: {e}")
             return {}
+        # Keyed on mtime/size so a rewritten file is parsed again
+        return _parse_bbl_header(bbl_path, st.st_mtime_ns, st.st_size)
 
     # Add a helper for debug level checks
     def debug(self, level):
-        levels = {"INFO": 1, "DEBUG": 2, "VERBOSE": 3}
-        return levels.get(getattr(self, 'debug_level', 'INFO'), 1) >= levels.get(level, 1)
+        return _DEBUG_LEVELS.get(getattr(self, 'debug_level', 'INFO'), 1) >= _DEBUG_LEVELS.get(level, 1)
 
 class SpectrogramWidget(QWidget):
     def __init__(self, feature_widget, parent=None):
@@ -3259,9 +3469,10 @@ class SpectrogramWidget(QWidget):
 
     def update_spectrogram(self, df, max_freq=None):
         import matplotlib.pyplot as plt
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
         from matplotlib import colors
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
         from scipy.ndimage import gaussian_filter
+        from utils.spectrogram_utils import calculate_spectrogram
 
         # Set plot style for consistency
         plt.style.use('default')
@@ -3287,14 +3498,7 @@ class SpectrogramWidget(QWidget):
         vmin = 0.01  # Fixed noise floor value
         
         # Calculate Nyquist frequency from data
-        time = self.df['time'].values.astype(float)
-        if time.max() > 1e6:
-            time = time / 1_000_000.0
-        elif time.max() > 1e3:
-            time = time / 1_000.0
-        time = time - time.min()
-        dt = np.mean(np.diff(time))
-        fs = 1.0 / dt if dt > 0 else 0.0
+        fs = sampling_rate(self.df['time'].to_numpy(copy=False))
         nyquist = fs / 2
         nperseg = 2 ** self.window_slider.value()
         noverlap = int(nperseg * 0.75)
@@ -3535,9 +3739,7 @@ class ErrorPerformanceWidget(QWidget):
         chart_view._tip_line = None  # For crosshair line
         crosshair_pen = QPen(QColor("red"), 1, Qt.SolidLine)
         if is_hist:
-            import numpy as np
             from scipy.stats import gaussian_kde
-            from PySide6.QtCore import QTimer
             # Use provided x_min/x_max for binning if given
             if x_min is not None and x_max is not None:
                 counts, bins = np.histogram(y, bins=100, range=(x_min, x_max))
@@ -3550,8 +3752,7 @@ class ErrorPerformanceWidget(QWidget):
                 step_x.extend([bins[i], bins[i+1]])
                 step_y.extend([counts[i], counts[i]])
             step_series = QLineSeries()
-            for xi, yi in zip(step_x, step_y):
-                step_series.append(xi, yi)
+            step_series.replace([QPointF(float(xi), float(yi)) for xi, yi in zip(step_x, step_y)])
             step_series.setColor(QColor("#a259e6"))  # purple
             step_series.setName("Histogram")
             # KDE curve
@@ -3559,8 +3760,7 @@ class ErrorPerformanceWidget(QWidget):
             kde_x = np.linspace(bins[0], bins[-1], 500)
             kde_y = kde(kde_x) * len(y) * (bins[1] - bins[0])  # scale to match histogram
             kde_series = QLineSeries()
-            for xi, yi in zip(kde_x, kde_y):
-                kde_series.append(xi, yi)
+            kde_series.replace([QPointF(xi, yi) for xi, yi in zip(kde_x.tolist(), kde_y.tolist())])
             kde_series.setColor(QColor("#00bfff"))  # cyan
             kde_series.setName("KDE")
             # Chart setup
@@ -3595,7 +3795,6 @@ class ErrorPerformanceWidget(QWidget):
                 x_max_val = x_axis.max()
                 epsilon = (x_max_val - x_min_val) * 1e-8
                 if (x_min_val - epsilon) < 0 < (x_max_val + epsilon):
-                    from PySide6.QtWidgets import QGraphicsLineItem
                     zero_pen = QPen(QColor("#00ff00"), 1, Qt.SolidLine)  # green
                     y_min = y_axis.min()
                     y_max = y_axis.max()
@@ -3636,7 +3835,6 @@ class ErrorPerformanceWidget(QWidget):
                     y_max = y_axis.max()
                     p1 = chart.mapToPosition(QPointF(xval, y_min))
                     p2 = chart.mapToPosition(QPointF(xval, y_max))
-                    from PySide6.QtWidgets import QGraphicsLineItem
                     tip_line = QGraphicsLineItem(p1.x(), p1.y(), p2.x(), p2.y())
                     tip_line.setPen(crosshair_pen)
                     chart.scene().addItem(tip_line)
@@ -3663,10 +3861,9 @@ class ErrorPerformanceWidget(QWidget):
             chart_view.setFont(fcc_font)
             chart_view.setStyleSheet("font-family: 'fccTYPO'; font-size: 12pt;")
         else:
-            import numpy as np
             series = QLineSeries()
-            for xi, yi in zip(x, y):
-                series.append(xi, yi)
+            # One bulk replace instead of a pointAdded round-trip per sample
+            series.replace([QPointF(float(xi), float(yi)) for xi, yi in zip(x, y)])
             series.setColor(color)
             chart.addSeries(series)
             x_axis = QValueAxis()
@@ -3698,7 +3895,6 @@ class ErrorPerformanceWidget(QWidget):
                     y_max = y_axis.max()
                     p1 = chart.mapToPosition(QPointF(xval, y_min))
                     p2 = chart.mapToPosition(QPointF(xval, y_max))
-                    from PySide6.QtWidgets import QGraphicsLineItem
                     tip_line = QGraphicsLineItem(p1.x(), p1.y(), p2.x(), p2.y())
                     tip_line.setPen(crosshair_pen)
                     chart.scene().addItem(tip_line)
@@ -3787,8 +3983,7 @@ class ErrorPerformanceWidget(QWidget):
                 actual_series = QLineSeries()
                 actual_series.setColor(QColor("magenta"))
                 actual_series.setName("Actual")
-                for xi, yi in zip(time, actual):
-                    actual_series.append(xi, yi)
+                actual_series.replace([QPointF(float(xi), float(yi)) for xi, yi in zip(time, actual)])
                 chart.addSeries(actual_series)
                 actual_series.attachAxis(chart.axisX())
                 actual_series.attachAxis(chart.axisY())
@@ -3855,7 +4050,6 @@ class HelpWidget(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Create scroll area for help content
-        from PySide6.QtWidgets import QScrollArea, QTextEdit
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setStyleSheet("""
@@ -3903,8 +4097,6 @@ class HelpWidget(QWidget):
     
     def create_font(self, font_type):
         """Create font based on configuration"""
-        from PySide6.QtGui import QFont
-        from utils.config import FONT_CONFIG
         font = QFont(FONT_CONFIG[font_type]['family'])
         font.setPointSize(FONT_CONFIG[font_type]['size'])
         if FONT_CONFIG[font_type]['weight'] == 'bold':
@@ -119,12 +119,17 @@ ALTERNATIVE_MOTOR_COLORS = [
     (140, 180, 70),     # Darker Lime
 ]
 
+# Hex names of the palettes above, resolved once for legend markup
+COLOR_PALETTE_HEX = {name: '#%02x%02x%02x' % rgb for name, rgb in COLOR_PALETTE.items()}
+MOTOR_COLORS_HEX = ['#%02x%02x%02x' % rgb for rgb in MOTOR_COLORS]
+
 # Chart configurations
 CHART_CONFIG = {
     'margins': (10, 10, 10, 10),
     'animation': False,
     'theme': 'light',
-    'legend_visible': False
+    'legend_visible': False,
+    'use_opengl': False  # Opt-in: render spectral/step charts through an OpenGL viewport if a GL context can be created
 }
 
 # Data processing configurations
@@ -132,4 +137,12 @@ DATA_CONFIG = {
     'max_points': 4000,  # Maximum points for decimation (reduced for better performance)
     'time_column': 'time',  # Default time column name
     'time_scale': 1_000_000.0  # Convert microseconds to seconds
-} 
\ No newline at end of file
+}
+
+# Export configurations
+EXPORT_CONFIG = {
+    'jpeg_quality': 90,  # Visually lossless for chart content, much smaller and faster than 100
+    'jpeg_optimize': True,  # Optimized Huffman tables
+    'jpeg_progressive': True,  # Progressive scan encoding
+    'dpi': 300  # Rasterization DPI for matplotlib figures in exports
+}
@@ -157,21 +157,42 @@ def process_gyro_data(time, gyro, throttle, name="", gain=1.0):
         'max': maxval
     }
 
+def _bin_indices(values, lo, hi, nbins):
+    """Bin index of each value for nbins equal bins over [lo, hi] (-1 if outside), like np.histogram"""
+    edges = np.linspace(lo, hi, nbins + 1)
+    idx = np.searchsorted(edges, values, side='right') - 1
+    # The last bin is closed on the right
+    idx[values == edges[-1]] = nbins - 1
+    # Out of range (and NaN) values fall in no bin
+    idx[(idx < 0) | (idx >= nbins) | (values < lo) | (values > hi)] = -1
+    return idx
+
+def _bin_spectra(throttle, freqs, weights, bins):
+    """Sum per-window spectra into a (throttle, frequency) grid, throttle rows first then frequency columns"""
+    n_throt, n_freq = bins
+    weights = np.asarray(weights, dtype=np.float64)
+    t_idx = _bin_indices(np.asarray(throttle, dtype=np.float64), 0, 100, n_throt)
+    f_idx = _bin_indices(np.asarray(freqs, dtype=np.float64), freqs[0], freqs[-1], n_freq)
+    # Out-of-range windows are dropped before summing, as histogram2d did, so they cannot leak NaNs in
+    t_valid = t_idx >= 0
+    by_throttle = np.zeros((n_throt, weights.shape[1]), dtype=np.float64)
+    np.add.at(by_throttle, t_idx[t_valid], weights[t_valid])
+    # freqs is sorted, so each frequency bin is a contiguous run of columns
+    f_valid = np.flatnonzero(f_idx >= 0)
+    grid = np.zeros((n_throt, n_freq), dtype=np.float64)
+    if f_valid.size:
+        f_bins, starts = np.unique(f_idx[f_valid], return_index=True)
+        grid[:, f_bins] = np.add.reduceat(by_throttle[:, f_valid], starts, axis=1)
+    return grid
+
 def create_2d_histogram(x, y, weights, bins):
     """Create a 2D histogram of weights mapped to x,y coordinates"""
-    # Prepare histogram
-    freqs = np.repeat(np.array([y], dtype=np.float64), len(x), axis=0)
-    throts = np.repeat(np.array([x], dtype=np.float64), len(y), axis=0).transpose()
-    
     # Get throttle histogram for normalization
     throt_hist, throt_scale = np.histogram(x, 101, [0, 100])
     
-    # Create 2D histogram
-    hist2d = np.histogram2d(
-        throts.flatten(), freqs.flatten(),
-        range=[[0, 100], [y[0], y[-1]]],
-        bins=bins, weights=weights.flatten(), density=False
-    )[0].transpose()
+    # Create 2D histogram; every window shares the same frequency axis, so bin
+    # throttle and frequency separately instead of histogramming the full repeated grid
+    hist2d = _bin_spectra(x, y, weights, bins).transpose()
     
     # Process histogram
     hist2d = np.array(abs(hist2d), dtype=np.float64)
@@ -179,9 +200,7 @@ def create_2d_histogram(x, y, weights, bins):
     
     # Normalize by throttle count
     nonzero_mask = throt_hist > 0
-    for i in range(hist2d_norm.shape[1]):
-        if i < len(nonzero_mask) and nonzero_mask[i]:
-            hist2d_norm[:, i] /= throt_hist[i]
+    hist2d_norm[:, nonzero_mask] /= throt_hist[nonzero_mask]
     
     return {
         'hist2d_norm': hist2d_norm,
@@ -531,8 +550,9 @@ def plot_all_noise_from_df(df, headdict=None, max_freq=1000, gain=1.0):
     """Compatibility function that calls the new implementation"""
     return plot_noise_from_df(df, max_freq, gain)
 
-def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
-    """Generate six individual matplotlib Figures for gyro/debug (roll, pitch, yaw)"""
+def compute_noise_results(df, gain=1.0):
+    """Compute the throttle/frequency noise histograms for every axis and trace type.
+    Pure numpy, so it is safe to run off the GUI thread. Returns None without a throttle column."""
     time = df['time'].values.astype(float)
     if time.max() > 1e6:
         time = time / 1_000_000.0
@@ -545,150 +565,13 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
             throttle_col = col
             break
     if throttle_col is None:
-        return []
+        return None
     throttle = df[throttle_col].values.astype(float)
     if throttle.max() > 500:
         throttle = ((throttle - 1000) / 10).clip(0, 100)
     else:
         throttle = throttle.clip(0, 100)
-    figures = []
     axis_labels = ['Roll', 'Pitch', 'Yaw']
-    for axis_idx, axis_name in enumerate(axis_labels):
-        # Gyro
-        gyro_col = None
-        for pattern in [f'gyroADC[{axis_idx}] (deg/s)', f'gyroADC[{axis_idx}]', f'gyro[{axis_idx}]']:
-            if pattern in df.columns:
-                gyro_col = pattern
-                break
-        if gyro_col:
-            gyro = df[gyro_col].values.astype(float)
-        else:
-            gyro = np.zeros_like(time)
-        gyro_result = process_gyro_data(time, gyro, throttle, name=f"gyro {axis_name}", gain=gain)
-        fig_gyro = plt.figure(figsize=(7, 5))
-        fig_gyro.patch.set_facecolor('white')
-        ax_gyro = fig_gyro.add_subplot(111)
-        if gyro_result is not None:
-            pc_gyro = ax_gyro.pcolormesh(
-                gyro_result['throt_axis'],
-                gyro_result['freq_axis'],
-                gyro_result['hist2d_sm'] + 1e-6,
-                norm=colors.LogNorm(vmin=1, vmax=gyro_result['max']+1),
-                cmap='inferno'
-            )
-            ax_gyro.set_title(f'Gyro (filtered) {axis_name}', color='black', loc='left', pad=5)
-            ax_gyro.set_ylabel('Frequency (Hz)', color='black')
-            ax_gyro.set_xlabel('Throttle (%)', color='black')
-            ax_gyro.set_ylim(0, max_freq)
-            ax_gyro.set_xlim(0, 100)
-            ax_gyro.set_facecolor('black')
-            ax_gyro.grid(True, color='white', alpha=0.3, linestyle='-')
-            ax_gyro.tick_params(axis='x', colors='black')
-            ax_gyro.tick_params(axis='y', colors='black')
-            for spine in ax_gyro.spines.values():
-                spine.set_color('black')
-            # Maximize plot area and eliminate black bar at top
-            fig_gyro.tight_layout(pad=0.5)
-        figures.append(fig_gyro)
-        # Debug (raw gyro data)
-        debug_col = None
-        for pattern in [f'gyroUnfilt[{axis_idx}]', f'debug[{axis_idx}]', f'debug{axis_idx}']:
-            if pattern in df.columns:
-                debug_col = pattern
-                break
-        if debug_col:
-            debug = df[debug_col].values.astype(float)
-        else:
-            debug = np.zeros_like(time)
-        debug_result = process_gyro_data(time, debug, throttle, name=f"debug {axis_name}", gain=gain)
-        fig_debug = plt.figure(figsize=(7, 5))
-        fig_debug.patch.set_facecolor('white')
-        ax_debug = fig_debug.add_subplot(111)
-        if debug_result is not None:
-            pc_debug = ax_debug.pcolormesh(
-                debug_result['throt_axis'],
-                debug_result['freq_axis'],
-                debug_result['hist2d_sm'] + 1e-6,
-                norm=colors.LogNorm(vmin=1, vmax=debug_result['max']+1),
-                cmap='inferno'
-            )
-            ax_debug.set_title(f'Gyro (raw) {axis_name}', color='black', loc='left', pad=5)
-            ax_debug.set_ylabel('Frequency (Hz)', color='black')
-            ax_debug.set_xlabel('Throttle (%)', color='black')
-            ax_debug.set_ylim(0, max_freq)
-            ax_debug.set_xlim(0, 100)
-            ax_debug.set_facecolor('black')
-            ax_debug.grid(True, color='white', alpha=0.3, linestyle='-')
-            ax_debug.tick_params(axis='x', colors='black')
-            ax_debug.tick_params(axis='y', colors='black')
-            for spine in ax_debug.spines.values():
-                spine.set_color('black')
-            # Maximize plot area and eliminate black bar at top
-            fig_debug.tight_layout(pad=0.5)
-        figures.append(fig_debug)
-        # D-term
-        dterm_col = f'axisD[{axis_idx}]'
-        if dterm_col in df.columns:
-            dterm = df[dterm_col].values.astype(float)
-        else:
-            dterm = np.zeros_like(time)
-        dterm_result = process_gyro_data(time, dterm, throttle, name=f"dterm {axis_name}", gain=gain)
-        fig_dterm = plt.figure(figsize=(7, 5))
-        fig_dterm.patch.set_facecolor('white')
-        ax_dterm = fig_dterm.add_subplot(111)
-        if dterm_result is not None:
-            pc_dterm = ax_dterm.pcolormesh(
-                dterm_result['throt_axis'],
-                dterm_result['freq_axis'],
-                dterm_result['hist2d_sm'] + 1e-6,
-                norm=colors.LogNorm(vmin=1, vmax=dterm_result['max']+1),
-                cmap='inferno'
-            )
-            ax_dterm.set_title(f'D-Term {axis_name}', color='black', loc='left', pad=5)
-            ax_dterm.set_ylabel('Frequency (Hz)', color='black')
-            ax_dterm.set_xlabel('Throttle (%)', color='black')
-            ax_dterm.set_ylim(0, max_freq)
-            ax_dterm.set_xlim(0, 100)
-            ax_dterm.set_facecolor('black')
-            ax_dterm.grid(True, color='white', alpha=0.3, linestyle='-')
-            ax_dterm.tick_params(axis='x', colors='black')
-            ax_dterm.tick_params(axis='y', colors='black')
-            for spine in ax_dterm.spines.values():
-                spine.set_color('black')
-            # Maximize plot area and eliminate black bar at top
-            fig_dterm.tight_layout(pad=0.5)
-        figures.append(fig_dterm)
-        
-        # Unfiltered D-term
-        d_gain = get_d_gain(df, axis_idx)
-        unfiltered_dterm = compute_unfiltered_dterm(debug, time, d_gain)
-        unfiltered_dterm_result = process_gyro_data(time, unfiltered_dterm, throttle, name=f"unfiltered dterm {axis_name}", gain=gain)
-        fig_unfiltered_dterm = plt.figure(figsize=(7, 5))
-        fig_unfiltered_dterm.patch.set_facecolor('white')
-        ax_unfiltered_dterm = fig_unfiltered_dterm.add_subplot(111)
-        if unfiltered_dterm_result is not None:
-            pc_unfiltered_dterm = ax_unfiltered_dterm.pcolormesh(
-                unfiltered_dterm_result['throt_axis'],
-                unfiltered_dterm_result['freq_axis'],
-                unfiltered_dterm_result['hist2d_sm'] + 1e-6,
-                norm=colors.LogNorm(vmin=1, vmax=unfiltered_dterm_result['max']+1),
-                cmap='inferno'
-            )
-            ax_unfiltered_dterm.set_title(f'D-Term (unfiltered) {axis_name}', color='black', loc='left', pad=5)
-            ax_unfiltered_dterm.set_ylabel('Frequency (Hz)', color='black')
-            ax_unfiltered_dterm.set_xlabel('Throttle (%)', color='black')
-            ax_unfiltered_dterm.set_ylim(0, max_freq)
-            ax_unfiltered_dterm.set_xlim(0, 100)
-            ax_unfiltered_dterm.set_facecolor('black')
-            ax_unfiltered_dterm.grid(True, color='white', alpha=0.3, linestyle='-')
-            ax_unfiltered_dterm.tick_params(axis='x', colors='black')
-            ax_unfiltered_dterm.tick_params(axis='y', colors='black')
-            for spine in ax_unfiltered_dterm.spines.values():
-                spine.set_color('black')
-            # Maximize plot area and eliminate black bar at top
-            fig_unfiltered_dterm.tight_layout(pad=0.5)
-        figures.append(fig_unfiltered_dterm)
-
     # Build results for all axes and types
     gyro_results = []
     debug_results = []
@@ -730,8 +613,29 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
         unfiltered_dterm = compute_unfiltered_dterm(debug, time, d_gain)
         unfiltered_dterm_results.append(process_gyro_data(time, unfiltered_dterm, throttle, name=f"unfiltered dterm {axis_labels[idx]}", gain=gain))
 
-    # Create a single figure with 12 axes (3x4)
-    fig = plt.figure(figsize=(30, 20))
+    return {
+        'axis_labels': axis_labels,
+        'gyro': gyro_results,
+        'debug': debug_results,
+        'dterm': dterm_results,
+        'unfiltered_dterm': unfiltered_dterm_results
+    }
+
+def build_noise_figures(results, max_freq=1000, fig=None):
+    """Build the combined noise figure from compute_noise_results output, redrawing into fig if given"""
+    if results is None:
+        return []
+    axis_labels = results['axis_labels']
+    gyro_results = results['gyro']
+    debug_results = results['debug']
+    dterm_results = results['dterm']
+    unfiltered_dterm_results = results['unfiltered_dterm']
+
+    # Create a single figure with 12 axes (3x4), or reuse the caller's figure
+    if fig is None:
+        fig = plt.figure(figsize=(30, 20))
+    else:
+        fig.clear()
     fig.patch.set_facecolor('white')
     # Further adjust spacing to completely eliminate the black bar at top
     gs = gridspec.GridSpec(3, 4, wspace=0.2, hspace=0.3, top=0.94, bottom=0.13, left=0.08, right=0.95)
@@ -749,7 +653,8 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
                     result['freq_axis'],
                     result['hist2d_sm'] + 1e-6,
                     norm=colors.LogNorm(vmin=1, vmax=result['max']+1),
-                    cmap='inferno'
+                    cmap='inferno',
+                    rasterized=True
                 )
                 all_pcs.append(pc)
                 vmax_list.append(result['max']+1)
@@ -764,8 +669,7 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
             ax.set_ylim(0, max_freq)
             ax.set_xlim(0, 100)
             ax.grid(True, color='white', alpha=0.3, linestyle='-')
-            ax.tick_params(axis='x', colors='black')
-            ax.tick_params(axis='y', colors='black')
+            ax.tick_params(axis='both', colors='black')
             for spine in ax.spines.values():
                 spine.set_color('black')
             # Set title inside the plot to avoid black space
@@ -780,11 +684,14 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
             ax.set_title(plot_title, color='black', fontsize=10, pad=5, loc='left')
             axes.append(ax)
 
+    # Keep a direct reference to the colorbar axis so callers need not scan fig.axes for it
+    fig.noise_cbar_ax = None
     # Add a single shared colorbar at the bottom
     if all_pcs:
         vmax_global = max(vmax_list)
         # Add a dedicated axis for the colorbar below the grid
         cbar_ax = fig.add_axes([0.15, 0.06, 0.7, 0.025])  # [left, bottom, width, height] in figure coordinates
+        fig.noise_cbar_ax = cbar_ax
         cbar = fig.colorbar(
             all_pcs[0], cax=cbar_ax, orientation='horizontal',
             norm=colors.LogNorm(vmin=1, vmax=vmax_global), cmap='inferno'
@@ -798,4 +705,8 @@ def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
         for spine in cbar.ax.spines.values():
             spine.set_visible(False)
     
-    return [fig] 
\ No newline at end of file
+    return [fig] 
+
+def generate_individual_noise_figures(df, max_freq=1000, gain=1.0):
+    """Generate the combined noise figure for gyro/debug/D-term (roll, pitch, yaw)"""
+    return build_noise_figures(compute_noise_results(df, gain=gain), max_freq=max_freq)
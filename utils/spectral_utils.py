@@ -0,0 +1,83 @@
+"""
+This file is part of a project licensed under the Non-Commercial Public License (NCPL).
+See LICENSE file or contact the authors for full terms.
+"""
+
+import numpy as np
+from functools import lru_cache
+
+@lru_cache(maxsize=16)
+def _hann_window(nperseg, dtype):
+    """Periodic Hann window and its power sum, cached per length and dtype."""
+    window = 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(nperseg) / nperseg)
+    window_power = float(np.sum(window ** 2))
+    window = window.astype(dtype)
+    window.setflags(write=False)
+    return window, window_power
+
+def sampling_rate(time_values):
+    """
+    Sampling rate in Hz of a monotonic time column (us, ms or s, detected like the plotting code).
+    Uses the endpoints only: the mean of np.diff telescopes to (t[-1] - t[0]) / (n - 1),
+    so no scaled or differenced copy of the column is needed.
+    """
+    t = np.asarray(time_values)
+    if len(t) < 2:
+        return 0.0
+    t_first = float(t[0])
+    t_last = float(t[-1])
+    scale = 1.0
+    if t_last > 1e6:
+        scale = 1_000_000.0
+    elif t_last > 1e3:
+        scale = 1_000.0
+    dt = (t_last - t_first) / scale / (len(t) - 1)
+    return 1.0 / dt if dt > 0 else 0.0
+
+def welch_batch(x_2d, fs, nperseg, noverlap):
+    """
+    Welch PSD estimate for several equally long signals at once.
+    Matches scipy.signal.welch with a Hann window, constant detrend and density scaling.
+    Returns (freqs, psd) where psd has one row per input row.
+    """
+    x = np.atleast_2d(np.asarray(x_2d))
+    n = x.shape[-1]
+    if nperseg > n:
+        nperseg = n
+        noverlap = nperseg // 2
+    step = nperseg - noverlap
+    # One view per segment, no copy until the detrend below
+    segments = np.lib.stride_tricks.sliding_window_view(x, nperseg, axis=-1)[..., ::step, :]
+    segments = segments - segments.mean(axis=-1, keepdims=True)
+    window, window_power = _hann_window(nperseg, x.dtype.str)
+    spec = np.fft.rfft(segments * window, axis=-1)
+    psd = (spec.real ** 2 + spec.imag ** 2).mean(axis=-2)
+    psd *= 1.0 / (fs * window_power)
+    # One-sided spectrum: double everything except DC (and Nyquist for even lengths)
+    if nperseg % 2:
+        psd[..., 1:] *= 2
+    else:
+        psd[..., 1:-1] *= 2
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / fs)
+    return freqs, psd
+
+def m4_downsample(x, y, n_buckets):
+    """
+    Reduce a sorted (x, y) curve to the first, last, min and max point of each
+    of n_buckets equal-width x buckets (M4 aggregation). Visually lossless when
+    n_buckets matches the plot width in pixels.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n_buckets = int(n_buckets)
+    if n_buckets <= 0 or len(x) <= 4 * n_buckets or x[-1] <= x[0]:
+        return x, y
+    bucket = ((x - x[0]) * (n_buckets / (x[-1] - x[0]))).astype(np.int64)
+    np.clip(bucket, 0, n_buckets - 1, out=bucket)
+    # x is sorted, so each bucket is a contiguous run
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(x)] - 1
+    # Sort by (bucket, y): the first/last entry of each run is its min/max
+    order = np.lexsort((y, bucket))
+    keep = np.unique(np.concatenate((starts, ends, order[starts], order[ends])))
+    return x[keep], y[keep]